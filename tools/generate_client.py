@@ -5,23 +5,167 @@ This script reads the BMRS OpenAPI specification and generates
 Python client methods for all API endpoints.
 """
 
+import argparse
+import functools
+import io
 import json
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib parser
+    orjson = None
+
+# Precompiled patterns used when deriving identifiers from the spec
+_NON_IDENT_RE = re.compile(r"[^a-zA-Z0-9_]")
+_MULTI_US_RE = re.compile(r"_+")
+_PATH_PARAM_RE = re.compile(r"\{([^}]+)\}")
+
+# HTTP methods that generate client methods, in generation order
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+# Path segments ignored when deriving method names from paths
+_COMMON_PREFIXES = frozenset({"api", "v1", "v2", "bmrs"})
+
+# HTTP method to method name prefix (other methods use their own name)
+_METHOD_PREFIX = {"get": "get", "post": "create", "put": "update", "delete": "delete"}
+
+# Generic wrapper schema markers and the class name suffix they add, most
+# specific first (matches generate_models.py)
+_WRAPPER_MARKERS = (
+    ("DatasetResponse-1_", "_DatasetResponse"),
+    ("ResponseWithMetadata-1_", "_ResponseWithMetadata"),
+    ("Response-1_", "_Response"),
+)
+
+# Python reserved keywords that need to be escaped
+RESERVED_KEYWORDS = frozenset({
+    'from', 'to', 'in', 'is', 'or', 'and', 'not', 'if', 'else', 'elif',
+    'for', 'while', 'break', 'continue', 'def', 'class', 'return', 'yield',
+    'import', 'as', 'pass', 'raise', 'try', 'except', 'finally', 'with',
+    'lambda', 'global', 'nonlocal', 'assert', 'del', 'exec', 'print'
+})
+
+# OpenAPI parameter type to Python type hint
+PARAM_TYPE_MAP = {
+    "string": "str",
+    "integer": "int",
+    "number": "float",
+    "boolean": "bool",
+    "array": "List[str]",
+    "object": "Dict[str, Any]",
+}
+
+# Templates for a generated client method; the variable sections are
+# pre-joined by generate_method and substituted in a single format call.
+# Endpoints without a response schema use the untyped template, which has a
+# fixed warning/return docstring and skips the response parsing block.
+_TYPED_METHOD_TEMPLATE = '''    def {method_name}(
+        {signature_params}
+    ) -> {response_model}:
+        """
+{intro}{args}        Returns:
+            {returns}
+        """
+        params = {{}}
+{query_block}
+        response = self._make_request("{http_method}", f"{api_path}", params=params)
+{parse_block}
+'''
+
+_UNTYPED_METHOD_TEMPLATE = '''    def {method_name}(
+        {signature_params}
+    ) -> Dict[str, Any]:
+        """
+{intro}        ⚠️  WARNING: This endpoint returns untyped Dict[str, Any]
+        The OpenAPI specification does not define a response schema for this endpoint.
+        You will not get type checking or IDE autocomplete for the response.
+
+{args}        Returns:
+            Dict[str, Any]: Untyped response data (no schema available)
+        """
+        params = {{}}
+{query_block}
+        response = self._make_request("{http_method}", f"{api_path}", params=params)
+        return response
+'''
+
+# Response parsing blocks appended after the request for typed endpoints
+_PARSE_HEADER = "        \n        # Parse response into Pydantic model(s)\n"
+
+_PARSE_STR_LIST_TEMPLATE = _PARSE_HEADER + '''        # Returns list of strings directly
+        return response'''
+
+_PARSE_LIST_TEMPLATE = _PARSE_HEADER + '''        if isinstance(response, list):
+            try:
+                return [{inner_model}(**item) for item in response]
+            except Exception as e:
+                import logging
+                logging.warning(f"Failed to parse list response as {response_model}: {{e}}. Returning raw data.")
+                return response
+        return response'''
+
+_PARSE_MODEL_TEMPLATE = _PARSE_HEADER + '''        if isinstance(response, dict):
+            try:
+                return {response_model}(**response)
+            except Exception as e:
+                import logging
+                logging.warning(f"Failed to parse response as {response_model}: {{e}}. Returning raw data.")
+                return response
+        return response'''
+
+
+# Header written at the top of the generated client module
+_CLIENT_HEADER = '''"""
+Auto-generated BMRS API client methods with typed Pydantic model returns.
+
+This file is automatically generated from the OpenAPI specification.
+Do not edit manually - changes will be overwritten.
+
+All methods return properly typed Pydantic models for type safety and IDE autocomplete.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+from datetime import date, datetime
+
+# Import all generated models
+from elexon_bmrs.generated_models import *
+
+# Import manually created models for endpoints with empty OpenAPI schemas
+from elexon_bmrs.untyped_models import (
+    HealthCheckResponse,
+    CDNResponse,
+    DemandResponse,
+    InitialDemandOutturn,
+    DemandSummaryItem,
+    RollingSystemDemandResponse,
+    DemandTotalActualResponse,
+    GenerationCurrentItem,
+    HalfHourlyInterconnectorResponse,
+)
+
+
+class GeneratedBMRSMethods:
+    """
+    Auto-generated methods for the BMRS API with typed returns.
+    
+    All methods return Pydantic models instead of Dict[str, Any] for:
+    - Type safety
+    - IDE autocomplete
+    - Validation
+    - Better developer experience
+    """
+
+'''
 
 
 class ClientCodeGenerator:
     """Generate Python client code from OpenAPI specification."""
-    
-    # Python reserved keywords that need to be escaped
-    RESERVED_KEYWORDS = {
-        'from', 'to', 'in', 'is', 'or', 'and', 'not', 'if', 'else', 'elif',
-        'for', 'while', 'break', 'continue', 'def', 'class', 'return', 'yield',
-        'import', 'as', 'pass', 'raise', 'try', 'except', 'finally', 'with',
-        'lambda', 'global', 'nonlocal', 'assert', 'del', 'exec', 'print'
-    }
 
     def __init__(self, spec: dict):
         """
@@ -66,49 +210,53 @@ class ClientCodeGenerator:
         """
         if operation_id:
             # Use operation ID if provided
-            name = re.sub(r"[^a-zA-Z0-9_]", "_", operation_id)
+            name = _NON_IDENT_RE.sub("_", operation_id)
             name = self._to_snake_case(name)
             # Remove consecutive underscores
-            name = re.sub(r"_+", "_", name)
+            name = _MULTI_US_RE.sub("_", name)
             name = name.strip("_")
             return name
 
-        # Extract meaningful parts from path
-        parts = [p for p in path.split("/") if p and not p.startswith("{")]
-
-        # Remove common prefixes
-        parts = [p for p in parts if p.lower() not in ["api", "v1", "v2", "bmrs"]]
-
-        # Replace hyphens and invalid chars with underscores
-        parts = [re.sub(r"[^a-zA-Z0-9_]", "_", p) for p in parts]
+        # Extract meaningful parts from path, dropping path parameters and
+        # common prefixes and replacing hyphens/invalid chars with underscores
+        parts = []
+        for p in path.split("/"):
+            if p and p[0] != "{" and p.lower() not in _COMMON_PREFIXES:
+                parts.append(_NON_IDENT_RE.sub("_", p))
 
         # Create method name
-        if method.lower() == "get":
-            prefix = "get"
-        elif method.lower() == "post":
-            prefix = "create"
-        elif method.lower() == "put":
-            prefix = "update"
-        elif method.lower() == "delete":
-            prefix = "delete"
-        else:
-            prefix = method.lower()
+        method_lower = method.lower()
+        prefix = _METHOD_PREFIX.get(method_lower, method_lower)
 
         name = "_".join([prefix] + parts)
         name = self._to_snake_case(name)
         # Remove consecutive underscores
-        name = re.sub(r"_+", "_", name)
+        name = _MULTI_US_RE.sub("_", name)
         name = name.strip("_")
         return name
 
-    def _to_snake_case(self, text: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _to_snake_case(text: str) -> str:
         """Convert text to snake_case."""
-        # Insert underscore before capitals
-        text = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", text)
-        text = re.sub("([a-z0-9])([A-Z])", r"\1_\2", text)
-        return text.lower()
+        # Insert underscore before capitals that follow a lowercase letter or
+        # digit, or that start a capitalised word (e.g. "HTTPResponse")
+        out = []
+        prev_low = False
+        last = len(text) - 1
+        for i, c in enumerate(text):
+            if c.isupper():
+                if prev_low or (0 < i < last and text[i + 1].islower()):
+                    out.append("_")
+                out.append(c.lower())
+            else:
+                out.append(c)
+            prev_low = c.islower() or c.isdigit()
+        return "".join(out)
     
-    def _escape_param_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _escape_param_name(name: str) -> str:
         """
         Escape parameter name if it's a Python reserved keyword.
         
@@ -118,7 +266,7 @@ class ClientCodeGenerator:
         Returns:
             Escaped parameter name (adds underscore suffix if reserved)
         """
-        if name.lower() in self.RESERVED_KEYWORDS:
+        if name.lower() in RESERVED_KEYWORDS:
             return f"{name}_"
         return name
 
@@ -130,16 +278,19 @@ class ClientCodeGenerator:
             operation: OpenAPI operation object
 
         Returns:
-            Dictionary of parameters by location (query, path, header)
+            Dictionary of parameters by location (query, path, header); each
+            parameter includes its keyword-safe Python name as "safe_name"
         """
         params = {"path": [], "query": [], "header": []}
 
         for param in operation.get("parameters", []):
             location = param.get("in", "query")
             if location in params:
+                name = param.get("name")
                 params[location].append(
                     {
-                        "name": param.get("name"),
+                        "name": name,
+                        "safe_name": self._escape_param_name(name),
                         "required": param.get("required", False),
                         "type": self._get_param_type(param),
                         "description": param.get("description", ""),
@@ -150,37 +301,26 @@ class ClientCodeGenerator:
 
     def _get_param_type(self, param: dict) -> str:
         """Get Python type hint for parameter."""
-        schema = param.get("schema", {})
-        param_type = schema.get("type", "string")
-
-        type_map = {
-            "string": "str",
-            "integer": "int",
-            "number": "float",
-            "boolean": "bool",
-            "array": "List[str]",
-            "object": "Dict[str, Any]",
-        }
-
-        return type_map.get(param_type, "str")
+        param_type = param.get("schema", {}).get("type", "string")
+        return PARAM_TYPE_MAP.get(param_type, "str")
     
-    def _sanitize_class_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _sanitize_class_name(name: str) -> str:
         """Convert schema name to valid Python class name (matches generate_models.py logic)."""
         # Handle wrapper type suffixes
         suffix = ""
-        if "DatasetResponse-1_" in name:
-            suffix = "_DatasetResponse"
-        elif "ResponseWithMetadata-1_" in name:
-            suffix = "_ResponseWithMetadata"
-        elif "Response-1_" in name and "-1_" in name:
-            suffix = "_Response"
+        for marker, marker_suffix in _WRAPPER_MARKERS:
+            if marker in name:
+                suffix = marker_suffix
+                break
         
         # Remove namespace prefixes
         name = name.split(".")[-1]
         
         # Replace invalid characters
-        name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-        name = re.sub(r"_+", "_", name)
+        name = _NON_IDENT_RE.sub("_", name)
+        name = _MULTI_US_RE.sub("_", name)
         
         # Ensure it starts with a letter
         if name and name[0].isdigit():
@@ -253,7 +393,7 @@ class ClientCodeGenerator:
 
     def generate_method(
         self, path: str, method: str, operation: dict
-    ) -> str:
+    ) -> Tuple[str, str]:
         """
         Generate Python method code for an API endpoint.
 
@@ -263,10 +403,11 @@ class ClientCodeGenerator:
             operation: OpenAPI operation object
 
         Returns:
-            Generated Python method code
+            Tuple of (method name, generated Python method code)
         """
-        method_name = self.generate_method_name(
-            path, method, operation.get("operationId")
+        # Interned so endpoint_to_model and duplicate checks share one object
+        method_name = sys.intern(
+            self.generate_method_name(path, method, operation.get("operationId"))
         )
         params = self.extract_parameters(operation)
         summary = operation.get("summary", "")
@@ -278,140 +419,147 @@ class ClientCodeGenerator:
 
         # Build method signature
         signature_params = ["self"]
+        signature_params += [
+            f"{param['safe_name']}: {param['type']}" for param in params["path"]
+        ]
+        signature_params += [
+            f"{param['safe_name']}: {param['type']}"
+            for param in params["query"]
+            if param["required"]
+        ]
+        signature_params += [
+            f"{param['safe_name']}: Optional[{param['type']}] = None"
+            for param in params["query"]
+            if not param["required"]
+        ]
+
+        # Build docstring sections (each line newline-terminated)
+        intro = ""
+        if summary:
+            intro += f"        {summary}\n\n"
 
-        # Add path parameters
-        for param in params["path"]:
-            type_hint = param["type"]
-            safe_name = self._escape_param_name(param['name'])
-            signature_params.append(f"{safe_name}: {type_hint}")
+        if description and description != summary:
+            intro += f"        {description}\n\n"
 
-        # Add required query parameters
-        for param in params["query"]:
-            if param["required"]:
-                type_hint = param["type"]
-                safe_name = self._escape_param_name(param['name'])
-                signature_params.append(f"{safe_name}: {type_hint}")
+        args = ""
+        if params["path"] or params["query"]:
+            args = "        Args:\n" + "".join(
+                f"            {param['safe_name']}: {param['description']}"
+                f"{'' if param['required'] else ', optional'}\n"
+                for param in params["path"] + params["query"]
+            ) + "\n"
 
-        # Add optional query parameters
+        # Build params dict
+        query_lines = []
         for param in params["query"]:
-            if not param["required"]:
-                type_hint = param["type"]
-                safe_name = self._escape_param_name(param['name'])
-                signature_params.append(f"{safe_name}: Optional[{type_hint}] = None")
+            param_name = param["name"]
+            safe_name = param["safe_name"]
+            if param["required"]:
+                query_lines.append(f'        params["{param_name}"] = {safe_name}\n')
+            else:
+                query_lines.append(
+                    f"        if {safe_name} is not None:\n"
+                    f'            params["{param_name}"] = {safe_name}\n'
+                )
 
-        signature = f"def {method_name}(\n        " + ",\n        ".join(signature_params) + f"\n    ) -> {response_model}:"
+        # Build path with substitutions
+        path_names = {param["name"]: param["safe_name"] for param in params["path"]}
+        api_path = _PATH_PARAM_RE.sub(
+            lambda m: "{" + path_names.get(m.group(1), m.group(1)) + "}", path
+        )
 
-        # Build docstring
-        docstring_lines = [f'        """']
-        if summary:
-            docstring_lines.append(f"        {summary}")
-            docstring_lines.append("")
+        fields = {
+            "method_name": method_name,
+            "signature_params": ",\n        ".join(signature_params),
+            "intro": intro,
+            "args": args,
+            "query_block": "".join(query_lines),
+            "http_method": method.upper(),
+            "api_path": api_path,
+        }
 
-        if description and description != summary:
-            docstring_lines.append(f"        {description}")
-            docstring_lines.append("")
-        
-        # Add warning for untyped endpoints
         if response_model == "Dict[str, Any]":
-            docstring_lines.append("        ⚠️  WARNING: This endpoint returns untyped Dict[str, Any]")
-            docstring_lines.append("        The OpenAPI specification does not define a response schema for this endpoint.")
-            docstring_lines.append("        You will not get type checking or IDE autocomplete for the response.")
-            docstring_lines.append("")
+            return method_name, _UNTYPED_METHOD_TEMPLATE.format(**fields)
 
-        if params["path"] or params["query"]:
-            docstring_lines.append("        Args:")
-            for param in params["path"] + params["query"]:
-                required_str = "" if param["required"] else ", optional"
-                safe_name = self._escape_param_name(param['name'])
-                docstring_lines.append(
-                    f"            {safe_name}: {param['description']}{required_str}"
-                )
-            docstring_lines.append("")
-
-        docstring_lines.append("        Returns:")
-        if response_model == "Dict[str, Any]":
-            docstring_lines.append("            Dict[str, Any]: Untyped response data (no schema available)")
-        elif response_model.startswith("List[str]"):
-            docstring_lines.append("            List[str]: List of string values")
+        # Add response parsing for the specific model
+        if response_model == "List[str]":
+            returns = "List[str]: List of string values"
+            parse_block = _PARSE_STR_LIST_TEMPLATE
         elif response_model.startswith("List["):
-            inner = response_model[5:-1]
-            docstring_lines.append(f"            {response_model}: List of {inner} objects")
+            inner_model = response_model[5:-1]
+            returns = f"{response_model}: List of {inner_model} objects"
+            parse_block = _PARSE_LIST_TEMPLATE.format(
+                inner_model=inner_model, response_model=response_model
+            )
         else:
-            docstring_lines.append(f"            {response_model}: Typed response object")
-        docstring_lines.append('        """')
+            returns = f"{response_model}: Typed response object"
+            parse_block = _PARSE_MODEL_TEMPLATE.format(response_model=response_model)
 
-        docstring = "\n".join(docstring_lines)
+        return method_name, _TYPED_METHOD_TEMPLATE.format(
+            response_model=response_model, returns=returns, parse_block=parse_block, **fields
+        )
 
-        # Build method body
-        body_lines = []
+    def _iter_operations(self) -> Iterator[Tuple[str, str]]:
+        """Yield (path, method) for every operation in the spec, in spec order."""
+        for path, path_item in self.paths.items():
+            for method in HTTP_METHODS:
+                if method in path_item:
+                    yield path, method
 
-        # Build params dict
-        if params["query"]:
-            body_lines.append("        params = {}")
-            for param in params["query"]:
-                param_name = param["name"]
-                safe_name = self._escape_param_name(param_name)
-                if param["required"]:
-                    body_lines.append(f'        params["{param_name}"] = {safe_name}')
-                else:
-                    body_lines.append(f"        if {safe_name} is not None:")
-                    body_lines.append(f'            params["{param_name}"] = {safe_name}')
-        else:
-            body_lines.append("        params = {}")
+    def _generate_methods(self, jobs: int = 1) -> Iterator[Tuple[str, str]]:
+        """
+        Generate (method name, code) for every operation, in spec order.
 
-        # Build path with substitutions
-        api_path = path
-        for param in params["path"]:
-            safe_name = self._escape_param_name(param['name'])
-            api_path = api_path.replace(
-                f"{{{param['name']}}}", f"{{{safe_name}}}"
+        Args:
+            jobs: Number of worker processes; 1 generates in this process
+        """
+        if jobs <= 1:
+            for path, method in self._iter_operations():
+                yield self.generate_method(path, method, self.paths[path][method])
+            return
+
+        # Workers build their own generator from the spec; the response model
+        # mapping is collected here so it matches a serial run
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(self.spec,)
+        ) as executor:
+            results = executor.map(
+                _generate_method_in_worker, list(self._iter_operations()), chunksize=16
             )
+            for method_name, method_code, response_model in results:
+                # Names arrive as fresh unpickled strings
+                method_name = sys.intern(method_name)
+                self.endpoint_to_model[method_name] = response_model
+                yield method_name, method_code
 
-        body_lines.append("")
-        body_lines.append(
-            f'        response = self._make_request("{method.upper()}", f"{api_path}", params=params)'
-        )
-        
-        # Add response parsing if we have a specific model
-        if response_model != "Dict[str, Any]":
-            body_lines.append(f"        ")
-            body_lines.append(f"        # Parse response into Pydantic model(s)")
-            
-            # Check if it's a List[Model] return type
-            if response_model.startswith("List["):
-                # Extract the model name from List[ModelName]
-                inner_model = response_model[5:-1]  # Remove "List[" and "]"
-                
-                # Special case: List[str] doesn't need parsing
-                if inner_model == "str":
-                    body_lines.append(f"        # Returns list of strings directly")
-                    body_lines.append(f"        return response")
-                else:
-                    # Parse list of models
-                    body_lines.append(f"        if isinstance(response, list):")
-                    body_lines.append(f"            try:")
-                    body_lines.append(f"                return [{inner_model}(**item) for item in response]")
-                    body_lines.append(f"            except Exception as e:")
-                    body_lines.append(f"                import logging")
-                    body_lines.append(f'                logging.warning(f"Failed to parse list response as {response_model}: {{e}}. Returning raw data.")')
-                    body_lines.append(f"                return response")
-                    body_lines.append(f"        return response")
-            else:
-                # Single model or wrapped response
-                body_lines.append(f"        if isinstance(response, dict):")
-                body_lines.append(f"            try:")
-                body_lines.append(f"                return {response_model}(**response)")
-                body_lines.append(f"            except Exception as e:")
-                body_lines.append(f"                import logging")
-                body_lines.append(f'                logging.warning(f"Failed to parse response as {response_model}: {{e}}. Returning raw data.")')
-                body_lines.append(f"                return response")
-                body_lines.append(f"        return response")
-        else:
-            body_lines.append(f"        return response")
+    def iter_methods(self, jobs: int = 1) -> Iterator[str]:
+        """
+        Generate client methods from the OpenAPI spec one at a time.
 
-        body = "\n".join(body_lines)
+        Args:
+            jobs: Number of worker processes to generate methods with
 
-        return f"    {signature}\n{docstring}\n{body}\n"
+        Yields:
+            Generated Python code for each unique method, in spec order
+        """
+        seen_method_names: Set[str] = set()
+
+        for method_name, method_code in self._generate_methods(jobs):
+            # Skip duplicate method names
+            if method_name not in seen_method_names:
+                seen_method_names.add(method_name)
+                yield method_code
+
+    def _write_methods(self, fp: TextIO, jobs: int = 1) -> int:
+        """Write all unique methods to fp, separated by blank lines; return the count."""
+        write = fp.write
+        method_count = 0
+        for method_code in self.iter_methods(jobs):
+            if method_count:
+                write("\n")
+            write(method_code)
+            method_count += 1
+        return method_count
 
     def generate_all_methods(self) -> str:
         """
@@ -420,80 +568,61 @@ class ClientCodeGenerator:
         Returns:
             Generated Python code for all methods
         """
-        methods = []
-        seen_method_names: Set[str] = set()
+        buf = io.StringIO()
+        self._write_methods(buf)
+        return buf.getvalue()
 
-        for path, path_item in self.paths.items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method in path_item:
-                    operation = path_item[method]
-                    method_code = self.generate_method(path, method, operation)
-
-                    # Extract method name to avoid duplicates
-                    method_name = method_code.split("(")[0].strip().split()[-1]
-
-                    if method_name not in seen_method_names:
-                        methods.append(method_code)
-                        seen_method_names.add(method_name)
+    def generate_full_client(self, fp: TextIO, jobs: int = 1) -> int:
+        """
+        Write the complete client file.
 
-        return "\n".join(methods)
+        Methods are streamed to ``fp`` as they are generated rather than
+        being assembled into a single string first.
 
-    def generate_full_client(self) -> str:
-        """
-        Generate complete client file.
+        Args:
+            fp: Open text file to write the generated client to
+            jobs: Number of worker processes to generate methods with
 
         Returns:
-            Complete Python client code
+            Number of methods written
         """
-        header = '''"""
-Auto-generated BMRS API client methods with typed Pydantic model returns.
+        fp.write(_CLIENT_HEADER)
+        return self._write_methods(fp, jobs)
 
-This file is automatically generated from the OpenAPI specification.
-Do not edit manually - changes will be overwritten.
 
-All methods return properly typed Pydantic models for type safety and IDE autocomplete.
-"""
+# Per-process generator used when generating methods in parallel
+_worker_generator: Optional[ClientCodeGenerator] = None
 
-from typing import Any, Dict, List, Optional, Union
-from datetime import date, datetime
 
-# Import all generated models
-from elexon_bmrs.generated_models import *
+def _init_worker(spec: dict) -> None:
+    """Build the generator once in each worker process."""
+    global _worker_generator
+    _worker_generator = ClientCodeGenerator(spec)
 
-# Import manually created models for endpoints with empty OpenAPI schemas
-from elexon_bmrs.untyped_models import (
-    HealthCheckResponse,
-    CDNResponse,
-    DemandResponse,
-    InitialDemandOutturn,
-    DemandSummaryItem,
-    RollingSystemDemandResponse,
-    DemandTotalActualResponse,
-    GenerationCurrentItem,
-    HalfHourlyInterconnectorResponse,
-)
 
+def _generate_method_in_worker(task: Tuple[str, str]) -> Tuple[str, str, str]:
+    """Generate one method in a worker, returning (name, code, response model)."""
+    path, method = task
+    generator = _worker_generator
+    method_name, method_code = generator.generate_method(
+        path, method, generator.paths[path][method]
+    )
+    return method_name, method_code, generator.endpoint_to_model[method_name]
 
-class GeneratedBMRSMethods:
-    """
-    Auto-generated methods for the BMRS API with typed returns.
-    
-    All methods return Pydantic models instead of Dict[str, Any] for:
-    - Type safety
-    - IDE autocomplete
-    - Validation
-    - Better developer experience
-    """
-
-'''
 
-        methods = self.generate_all_methods()
-
-        return header + methods
-
-
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate BMRS client methods from the OpenAPI spec"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for method generation (default: 1; only worth it for very large specs)",
+    )
+    args = parser.parse_args(argv)
+
     print("\n╔" + "=" * 58 + "╗")
     print("║" + " " * 15 + "BMRS Client Code Generator" + " " * 17 + "║")
     print("╚" + "=" * 58 + "╝\n")
@@ -508,8 +637,11 @@ def main() -> int:
         return 1
 
     print(f"Loading OpenAPI spec from: {spec_path}")
-    with open(spec_path, "r", encoding="utf-8") as f:
-        spec = json.load(f)
+    if orjson is not None:
+        spec = orjson.loads(spec_path.read_bytes())
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
     
     # Handle spec wrapped in array (some APIs return [spec] instead of spec)
     if isinstance(spec, list):
@@ -523,17 +655,15 @@ def main() -> int:
     # Generate client code
     print("Generating client methods...")
     generator = ClientCodeGenerator(spec)
-    client_code = generator.generate_full_client()
 
-    # Save generated code
+    # Stream generated code straight to the output file
     output_path = script_dir.parent / "elexon_bmrs" / "generated_client.py"
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(client_code)
+        method_count = generator.generate_full_client(f, jobs=args.jobs)
 
     print(f"✓ Generated client code saved to: {output_path}")
 
     # Print statistics
-    method_count = client_code.count("def ")
     print(f"\n✓ Generated {method_count} methods")
 
     print("\nNext steps:")
@@ -11,6 +11,28 @@ from pathlib import Path
 from typing import Dict, Set
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib parser
+    orjson = None
+
+# Precompiled patterns used when deriving enum member and class names
+_NON_IDENT_RE = re.compile(r'[^a-zA-Z0-9_]')
+_MULTI_US_RE = re.compile(r'_+')
+_SPLIT_RE = re.compile(r'[_\s]+')
+
+# Example value types that are recorded as enum candidates
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _to_class_name(field_name: str) -> str:
+    """Convert a field name to its enum class name (e.g., psrType -> PsrtypeEnum)."""
+    class_name = ''.join(word.capitalize() for word in _SPLIT_RE.split(field_name))
+    if not class_name.endswith('Enum'):
+        class_name += 'Enum'
+    return class_name
+
 
 class EnumGenerator:
     """Generate enum types from OpenAPI spec."""
@@ -112,31 +134,34 @@ class EnumGenerator:
         self.spec = spec
         self.schemas = spec.get("components", {}).get("schemas", {})
         self.field_examples = defaultdict(set)
+        self.class_names = {
+            field_name: _to_class_name(field_name) for field_name in self.KNOWN_ENUMS
+        }
         self._extract_examples()
     
     def _extract_examples(self):
         """Extract example values from the spec."""
-        for schema_name, schema in self.schemas.items():
-            properties = schema.get('properties', {})
-            for field_name, field_def in properties.items():
+        add_map = self.field_examples
+        for schema in self.schemas.values():
+            for field_name, field_def in schema.get('properties', {}).items():
                 # Check for examples
                 if 'example' in field_def:
                     ex = field_def['example']
-                    if isinstance(ex, (str, int, float, bool)):
-                        self.field_examples[field_name].add(str(ex))
+                    if isinstance(ex, _SCALAR_TYPES):
+                        add_map[field_name].add(ex if isinstance(ex, str) else str(ex))
                 if 'examples' in field_def:
                     examples = field_def['examples']
                     if isinstance(examples, list):
-                        for ex in examples:
-                            if isinstance(ex, (str, int, float, bool)):
-                                self.field_examples[field_name].add(str(ex))
+                        add_map[field_name].update(
+                            str(ex) for ex in examples if isinstance(ex, _SCALAR_TYPES)
+                        )
     
     def sanitize_enum_name(self, value: str) -> str:
         """Convert a value to a valid Python enum member name."""
         # Replace spaces and special characters with underscores
-        name = re.sub(r'[^a-zA-Z0-9_]', '_', value)
+        name = _NON_IDENT_RE.sub('_', value)
         # Remove consecutive underscores
-        name = re.sub(r'_+', '_', name)
+        name = _MULTI_US_RE.sub('_', name)
         # Remove leading/trailing underscores
         name = name.strip('_')
         # Ensure it starts with a letter or underscore
@@ -148,13 +173,16 @@ class EnumGenerator:
     
     def generate_enum_class(self, enum_name: str, values: list) -> str:
         """Generate a Python Enum class."""
-        lines = []
-        lines.append(f"class {enum_name}(str, Enum):")
-        lines.append(f'    """Enum for {enum_name} field values."""')
-        lines.append("")
+        lines = [
+            f"class {enum_name}(str, Enum):",
+            f'    """Enum for {enum_name} field values."""',
+            "",
+        ]
         
-        # Track used names to handle duplicates
+        # Track used names to handle duplicates, remembering the next
+        # numeric suffix to try for each base name
         used_names = set()
+        next_suffix: Dict[str, int] = {}
         
         for value in sorted(values):
             member_name = self.sanitize_enum_name(value)
@@ -162,9 +190,10 @@ class EnumGenerator:
             # Handle duplicate names
             if member_name in used_names:
                 # Add numeric suffix
-                counter = 2
+                counter = next_suffix.get(member_name, 2)
                 while f"{member_name}_{counter}" in used_names:
                     counter += 1
+                next_suffix[member_name] = counter + 1
                 member_name = f"{member_name}_{counter}"
             
             used_names.add(member_name)
@@ -180,12 +209,7 @@ class EnumGenerator:
         
         # Generate enums for known enum fields
         for field_name, values in sorted(self.KNOWN_ENUMS.items()):
-            # Convert field name to class name (e.g., psrType -> PsrType)
-            class_name = ''.join(word.capitalize() for word in re.split(r'[_\s]+', field_name))
-            if not class_name.endswith('Enum'):
-                class_name += 'Enum'
-            
-            enum_code = self.generate_enum_class(class_name, values)
+            enum_code = self.generate_enum_class(self.class_names[field_name], values)
             enums.append(enum_code)
         
         # Build header
@@ -221,8 +245,11 @@ def main():
         return 1
     
     print(f"Loading OpenAPI spec from: {spec_path}")
-    with open(spec_path, "r", encoding="utf-8") as f:
-        spec = json.load(f)
+    if orjson is not None:
+        spec = orjson.loads(spec_path.read_bytes())
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
     
     # Handle spec wrapped in array
     if isinstance(spec, list):
@@ -252,10 +279,7 @@ def main():
     
     print("\nGenerated enums:")
     for field_name, values in sorted(generator.KNOWN_ENUMS.items()):
-        class_name = ''.join(word.capitalize() for word in re.split(r'[_\s]+', field_name))
-        if not class_name.endswith('Enum'):
-            class_name += 'Enum'
-        print(f"  - {class_name}: {len(values)} values")
+        print(f"  - {generator.class_names[field_name]}: {len(values)} values")
     
     print("\nNext steps:")
     print("  1. Review generated enums: elexon_bmrs/enums.py")
@@ -5,11 +5,170 @@ This script reads the BMRS OpenAPI specification and generates
 Pydantic models for all schema definitions.
 """
 
+import argparse
+import functools
+import io
 import json
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Set, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Set, Optional, TextIO, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib parser
+    orjson = None
+
+
+# Precompiled patterns used for class name sanitization
+_RE_INVALID_CLASS = re.compile(r"[^a-zA-Z0-9_]")
+_RE_COLLAPSE_UNDERSCORES = re.compile(r"_+")
+
+
+# ASCII character classes for the camelCase split in field names
+_CAMEL_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_CAMEL_LOWER_OR_DIGIT = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+# Characters allowed in generated field names; anything else becomes '_'
+_FIELD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_")
+_UNDERSCORE = ord("_")
+
+
+class _FieldCharMap(dict):
+    """str.translate table that fills itself in on first sight of a character."""
+
+    def __missing__(self, char: int) -> int:
+        value = char if chr(char) in _FIELD_CHARS else _UNDERSCORE
+        self[char] = value
+        return value
+
+
+_FIELD_TRANS = _FieldCharMap()
+
+
+# Python keywords that need an underscore suffix in field names
+_FIELD_KEYWORDS = frozenset({
+    'from', 'to', 'in', 'is', 'or', 'and', 'not', 'if', 'else',
+    'for', 'while', 'def', 'class', 'return', 'import', 'as'
+})
+
+
+# Header written at the top of the generated models module; imports that
+# depend on which enums and mixins are used are appended after it
+_MODELS_HEADER = '''"""
+Auto-generated Pydantic models from BMRS OpenAPI specification.
+
+This file is automatically generated. Do not edit manually.
+"""
+
+from __future__ import annotations  # Enable forward references
+
+from typing import Any, Dict, List, Optional, Union
+from datetime import date, datetime
+from pydantic import BaseModel, Field, ConfigDict
+'''
+
+
+# Validator mixins aliased at the top of the generated module
+_VALIDATOR_MIXINS = (
+    'SettlementPeriodMixin', 'SettlementDateMixin', 'TimeRangeMixin', 'LevelRangeMixin',
+    'PublishTimeMixin', 'StartTimeMixin', 'DocumentMixin', 'DatasetMixin',
+    'FlowDirectionMixin', 'BmUnitMixin', 'QuantityMixin', 'PriceMixin',
+    'FuelTypeMixin', 'PsrTypeMixin', 'BusinessTypeMixin', 'CreatedDateTimeMixin',
+    'RevisionMixin', 'AssetMixin', 'MessageMixin', 'EventMixin', 'EventTimeMixin',
+    'AffectedUnitMixin', 'ParticipantMixin', 'AcceptanceMixin', 'BidOfferMixin',
+    'PairIdMixin', 'FlagsMixin', 'CapacityMixin', 'LeadPartyMixin', 'MridMixin',
+    'VolumeMixin', 'CostMixin', 'DemandMixin', 'GenerationMixin', 'MarginMixin',
+    'SurplusMixin', 'ImbalanceMixin', 'FrequencyMixin', 'TemperatureMixin',
+    'YearMixin', 'WeekMixin', 'MonthMixin', 'ForecastDateMixin', 'BoundaryMixin',
+    'OutputUsableMixin', 'BiddingZoneMixin', 'InterconnectorMixin',
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_class_name(name: str, original_name: str) -> str:
+    """Cached implementation of PydanticModelGenerator.sanitize_class_name."""
+    # Detect wrapper types and add descriptive suffixes
+    # This resolves duplicate class names from generic wrapper types
+    suffix = ""
+    if "DatasetResponse-1_" in original_name:
+        suffix = "_DatasetResponse"
+    elif "ResponseWithMetadata-1_" in original_name:
+        suffix = "_ResponseWithMetadata"
+    elif "Response-1_" in original_name and "-1_" in original_name:
+        suffix = "_Response"
+    
+    # Remove namespace prefixes (e.g., "Insights.Api.Models.")
+    name = name.split(".")[-1]
+    
+    # Replace invalid characters
+    name = _RE_INVALID_CLASS.sub("_", name)
+    
+    # Remove consecutive underscores
+    name = _RE_COLLAPSE_UNDERSCORES.sub("_", name)
+    
+    # Ensure it starts with a letter
+    if name and name[0].isdigit():
+        name = f"Model_{name}"
+    
+    # Remove leading/trailing underscores
+    name = name.strip("_")
+    
+    # Add suffix for wrapper types
+    result = (name + suffix) if suffix else name
+    
+    return result or "UnnamedModel"
+
+
+def _split_camel_case(name: str) -> str:
+    """Insert '_' between a lowercase letter or digit and a following capital."""
+    out = []
+    prev = ""
+    for char in name:
+        if char in _CAMEL_UPPER and prev in _CAMEL_LOWER_OR_DIGIT:
+            out.append("_")
+        out.append(char)
+        prev = char
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_field_name(name: str) -> str:
+    """Cached implementation of PydanticModelGenerator.sanitize_field_name."""
+    # Convert camelCase to snake_case
+    # Insert underscore before uppercase letters that follow lowercase letters
+    name = _split_camel_case(name)
+    # Convert to lowercase
+    name = name.lower()
+    
+    # Replace invalid characters
+    name = name.translate(_FIELD_TRANS)
+    
+    # Python keywords need underscore suffix
+    if name in _FIELD_KEYWORDS:
+        name = f"{name}_"
+    
+    # Remove consecutive underscores
+    while "__" in name:
+        name = name.replace("__", "_")
+    
+    return name.strip("_") or "field"
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_alias(field_name: str) -> str:
+    """Format the alias argument of a generated Field(...)."""
+    return f'alias="{field_name}"'
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_description(description: str) -> str:
+    """Format the description argument of a generated Field(...), escaped for a string literal."""
+    description = description.replace("\\", "\\\\").replace('"', '\\"')
+    return f', description="{description}"'
 
 
 class PydanticModelGenerator:
@@ -35,6 +194,224 @@ class PydanticModelGenerator:
         "double": "float",
     }
 
+    # Common (type, format) pairs resolved up front; the format takes
+    # precedence over the type, as in _get_base_type
+    _BASE_TYPE_DISPATCH = {
+        ("string", None): "str",
+        ("string", "date"): "date",
+        ("string", "date-time"): "datetime",
+        ("integer", None): "int",
+        ("integer", "int32"): "int",
+        ("integer", "int64"): "int",
+        ("number", None): "float",
+        ("number", "float"): "float",
+        ("number", "double"): "float",
+        ("boolean", None): "bool",
+        ("array", None): "List",
+        ("object", None): "Dict[str, Any]",
+    }
+
+    # Map field combinations to field mixin classes (comprehensive set)
+    FIELD_MIXIN_MAP = MappingProxyType({
+        frozenset({'settlementDate', 'settlementPeriod'}): 'SettlementFields',
+        frozenset({'timeFrom', 'timeTo'}): 'TimeRangeFields',
+        frozenset({'startTime', 'endTime'}): 'StartEndTimeFields',
+        frozenset({'levelFrom', 'levelTo'}): 'LevelFields',
+        frozenset({'bmUnit', 'nationalGridBmUnit'}): 'BmUnitFields',
+        frozenset({'documentId', 'documentRevisionNumber'}): 'DocumentFields',
+        frozenset({'settlementPeriodFrom', 'settlementPeriodTo'}): 'SettlementPeriodRangeFields',
+        frozenset({'acceptanceNumber', 'acceptanceTime'}): 'AcceptanceFields',
+        frozenset({'bidPrice', 'offerPrice'}): 'BidOfferPriceFields',
+        frozenset({'bidVolume', 'offerVolume'}): 'BidOfferVolumeFields',
+        frozenset({'bidPrice', 'bidVolume', 'offerPrice', 'offerVolume'}): 'BidOfferFields',
+        frozenset({'minimumPossible', 'maximumAvailable'}): 'CapacityFields',
+    })
+
+    # Every field that appears in some FIELD_MIXIN_MAP combination
+    _COMBO_TRIGGER_FIELDS = frozenset().union(*FIELD_MIXIN_MAP)
+    
+    # Map single fields to field mixin classes (comprehensive set from schema analysis)
+    SINGLE_FIELD_MIXIN_MAP = MappingProxyType({
+        'dataset': 'DatasetFields',
+        'publishTime': 'PublishTimeFields',
+        'startTime': 'StartTimeFields',
+        'quantity': 'QuantityFields',
+        'year': 'YearFields',
+        'forecastDate': 'ForecastDateFields',
+        'demand': 'DemandFields',
+        'psrType': 'PsrTypeFields',
+        'fuelType': 'FuelTypeFields',
+        'boundary': 'BoundaryFields',
+        'businessType': 'BusinessTypeFields',
+        'generation': 'GenerationFields',
+        'volume': 'VolumeFields',
+        'outputUsable': 'OutputUsableFields',
+        'revisionNumber': 'RevisionNumberFields',
+        'week': 'WeekFields',
+        'assetId': 'AssetFields',
+        'createdDateTime': 'CreatedDateTimeFields',
+        'flowDirection': 'FlowDirectionFields',
+        'messageType': 'MessageTypeFields',
+        'biddingZone': 'BiddingZoneFields',
+        'id': 'IdFields',
+        'transmissionSystemDemand': 'TransmissionDemandFields',
+        'margin': 'MarginFields',
+        'soFlag': 'SoFlagFields',
+        'storFlag': 'StorFlagFields',
+        'bmUnitType': 'BmUnitTypeFields',
+        'leadPartyName': 'LeadPartyFields',
+        'nationalDemand': 'NationalDemandFields',
+        'surplus': 'SurplusFields',
+        'systemZone': 'SystemZoneFields',
+        'interconnectorName': 'InterconnectorFields',
+        'amendmentFlag': 'AmendmentFlagFields',
+        'activeFlag': 'ActiveFlagFields',
+        'time': 'TimeFields',
+    })
+
+    # Every field mixin class, sorted, aliased at the top of the generated module
+    _FIELD_MIXIN_ALIASES = tuple(sorted(set(FIELD_MIXIN_MAP.values()) | set(SINGLE_FIELD_MIXIN_MAP.values())))
+    
+    # Map field names to their enum types
+    FIELD_TO_ENUM = MappingProxyType({
+        'dataset': 'DatasetEnum',
+        'psrType': 'PsrtypeEnum',
+        'fuelType': 'FueltypeEnum',
+        'businessType': 'BusinesstypeEnum',
+        'messageType': 'MessagetypeEnum',
+        'eventType': 'EventtypeEnum',
+        'processType': 'ProcesstypeEnum',
+        'warningType': 'WarningtypeEnum',
+        'assetType': 'AssettypeEnum',
+        'eventStatus': 'EventstatusEnum',
+        'unavailabilityType': 'UnavailabilitytypeEnum',
+        'flowDirection': 'FlowdirectionEnum',
+        'tradeDirection': 'TradedirectionEnum',
+        'marketAgreementType': 'MarketagreementtypeEnum',
+        'boundary': 'BoundaryEnum',
+        'recordType': 'RecordtypeEnum',
+        'deliveryMode': 'DeliverymodeEnum',
+        'settlementRunType': 'SettlementruntypeEnum',
+        'bmUnitType': 'BmunittypeEnum',
+        'priceDerivationCode': 'PricederivationcodeEnum',
+        'systemZone': 'SystemzoneEnum',
+        'amendmentFlag': 'AmendmentflagEnum',
+    })
+    
+    # Fields that should be inferred as required (not optional)
+    # Based on BMRS API usage patterns - these are fields that are
+    # consistently present in API responses
+    INFERRED_REQUIRED_FIELDS = frozenset({
+        # Core identification fields - ALWAYS present
+        'dataset', 'documentId', 'publishTime', 'settlementDate', 'settlementPeriod',
+        'startTime', 'timeFrom', 'measurementTime', 'createdDateTime',
+        'halfHourEndTime', 'messageReceivedDateTime', 'documentRevisionNumber',
+        'timeSeriesId', 'mrid', 'mRID', 'createdTime',
+        
+        # Settlement period ranges
+        'settlementPeriodFrom', 'settlementPeriodTo',
+        
+        # BM Unit identification - present when relevant
+        'bmUnit', 'nationalGridBmUnit', 'nationalGridBmUnitId', 'bmUnitType',
+        
+        # Core data fields - the actual data values
+        'quantity', 'generation', 'demand', 'price', 'cost', 'volume',
+        'frequency', 'temperature', 'transmissionSystemDemand', 'nationalDemand',
+        'outputUsable', 'margin', 'surplus', 'imbalance',
+        
+        # Status and type fields - classification data
+        'businessType', 'psrType', 'fuelType', 'messageType', 'processType',
+        'warningType', 'messageHeading', 'eventType', 'unavailabilityType',
+        'assetType', 'eventStatus', 'amendmentFlag',
+        
+        # ID fields - identifiers
+        'id', 'acceptanceNumber', 'pairId', 'acceptanceId',
+        'participantId', 'assetId', 'affectedUnit', 'demandControlId',
+        'bidId', 'sequenceId', 'messageId',
+        
+        # Direction and flow fields
+        'flowDirection', 'tradeDirection',
+        
+        # Contract and market fields
+        'marketAgreementType', 'contractIdentification',
+        
+        # Trade fields
+        'tradeQuantity', 'tradePrice', 'traderUnit',
+        
+        # Capacity and limit fields that are typically present
+        'normalCapacity', 'availableCapacity', 'unavailableCapacity',
+        
+        # Time-related fields
+        'eventStartTime', 'eventEndTime', 'acceptanceTime',
+        'publishingPeriodCommencingTime',
+        
+        # Location/zone fields
+        'affectedArea', 'biddingZone', 'systemZone', 'interconnectorName',
+        
+        # Forecast fields
+        'forecastDate', 'forecastWeek', 'forecastYear', 'weekStartDate',
+        'calendarWeekNumber',
+        
+        # Other commonly required fields
+        'cause', 'revisionNumber', 'affectedDso',
+        'instructionSequence', 'demandControlEventFlag',
+        'leadPartyName', 'leadPartyId', 'gspGroupId',
+        'minimumPossible', 'maximumAvailable',
+        'amount', 'energyPrice', 'procurementPrice',
+    })
+
+    # Validator mixins (methods only, no fields), in the order they are
+    # applied. Each rule is (mixin, trigger fields, match_all, uncovered_only):
+    # match_all requires every trigger field instead of any one of them, and
+    # uncovered_only ignores fields already provided by a field mixin.
+    _VALIDATOR_MIXIN_RULES = (
+        # Settlement date without period
+        ('SettlementDateMixin', frozenset({'settlementDate'}), False, True),
+        ('AcceptanceMixin', frozenset({'acceptanceNumber'}), False, False),  # 3+ models
+        ('AffectedUnitMixin', frozenset({'affectedUnit'}), False, False),  # 4 models
+        ('AssetMixin', frozenset({'assetId'}), False, False),  # 6+ models
+        ('BidOfferMixin', frozenset({'bid', 'offer'}), True, False),
+        ('BmUnitMixin', frozenset({'bmUnit', 'nationalGridBmUnit'}), False, False),  # 22+ models
+        ('BusinessTypeMixin', frozenset({'businessType'}), False, False),  # 10 models
+        ('CapacityMixin', frozenset({'normalCapacity', 'availableCapacity'}), False, False),
+        ('CreatedDateTimeMixin', frozenset({'createdDateTime'}), False, False),  # 6 models
+        ('DatasetMixin', frozenset({'dataset'}), False, False),
+        ('EventMixin', frozenset({'eventType', 'eventStatus'}), True, False),  # 4 models
+        ('EventTimeMixin', frozenset({'eventStartTime', 'eventEndTime'}), True, False),
+        ('FlagsMixin', frozenset({'deemedBoFlag', 'soFlag', 'storFlag', 'rrFlag'}), False, False),
+        ('FlowDirectionMixin', frozenset({'flowDirection'}), False, False),  # 6+ models
+        ('FuelTypeMixin', frozenset({'fuelType'}), False, False),  # 12 models
+        ('LeadPartyMixin', frozenset({'leadPartyName'}), False, False),
+        ('MessageMixin', frozenset({'messageHeading', 'messageType'}), True, False),  # 4 models
+        ('MridMixin', frozenset({'mrid', 'mRID'}), False, False),  # 3+ models
+        ('PairIdMixin', frozenset({'pairId'}), False, False),
+        ('ParticipantMixin', frozenset({'participantId'}), False, False),  # 3+ models
+        ('VolumeMixin', frozenset({'volume'}), False, False),  # 8 models
+        ('CostMixin', frozenset({'cost'}), False, False),  # 3+ models
+        ('DemandMixin', frozenset({'demand'}), False, False),  # 3+ models
+        ('GenerationMixin', frozenset({'generation'}), False, False),  # 3+ models
+        ('MarginMixin', frozenset({'margin'}), False, False),  # 5 models
+        ('SurplusMixin', frozenset({'surplus'}), False, False),  # 4 models
+        ('ImbalanceMixin', frozenset({'imbalance'}), False, False),
+        ('FrequencyMixin', frozenset({'frequency'}), False, False),
+        ('TemperatureMixin', frozenset({'temperature'}), False, False),
+        ('YearMixin', frozenset({'year'}), False, False),  # 14 models
+        ('WeekMixin', frozenset({'week'}), False, False),  # 7 models
+        ('MonthMixin', frozenset({'month'}), False, False),
+        ('ForecastDateMixin', frozenset({'forecastDate'}), False, False),  # 13 models
+        ('BoundaryMixin', frozenset({'boundary'}), False, False),  # 10 models
+        ('OutputUsableMixin', frozenset({'outputUsable'}), False, False),  # 8 models
+        ('BiddingZoneMixin', frozenset({'biddingZone'}), False, False),  # 5 models
+        ('InterconnectorMixin', frozenset({'interconnectorName'}), False, False),  # 4 models
+        ('PriceMixin', frozenset({'price'}), False, False),  # 50+ models
+        ('PsrTypeMixin', frozenset({'psrType'}), False, False),  # 13 models
+        ('PublishTimeMixin', frozenset({'publishTime'}), False, False),  # 86 models
+        ('QuantityMixin', frozenset({'quantity'}), False, False),  # 80+ models
+        ('RevisionMixin', frozenset({'revisionNumber'}), False, False),  # 7 models
+        # Start time only if not already in a field mixin
+        ('StartTimeMixin', frozenset({'startTime'}), False, True),  # 56 models
+    )
+
     def __init__(self, spec: dict):
         """
         Initialize the generator.
@@ -46,161 +423,12 @@ class PydanticModelGenerator:
         self.schemas = spec.get("components", {}).get("schemas", {})
         self.generated_models: Set[str] = set()
         self.class_name_counts: Dict[str, int] = {}  # Track name collisions
-        self.imports: Set[str] = set()
-        
-        # Add base imports
-        self.base_imports = [
-            "from typing import Any, Dict, List, Optional, Union",
-            "from datetime import date, datetime",
-            "from pydantic import BaseModel, Field, ConfigDict",
-        ]
+        self._sorted_keys: Optional[List[str]] = None  # Schema names, sorted on first use
+        self._name_map: Dict[str, str] = {}  # Schema name -> final class name
         self.imports: Set[str] = set()
         self.uses_enums = False
         self.uses_validators = False
         self.uses_field_mixins = False
-        
-        # Map field combinations to field mixin classes (comprehensive set)
-        self.field_mixin_map = {
-            frozenset(['settlementDate', 'settlementPeriod']): 'SettlementFields',
-            frozenset(['timeFrom', 'timeTo']): 'TimeRangeFields',
-            frozenset(['startTime', 'endTime']): 'StartEndTimeFields',
-            frozenset(['levelFrom', 'levelTo']): 'LevelFields',
-            frozenset(['bmUnit', 'nationalGridBmUnit']): 'BmUnitFields',
-            frozenset(['documentId', 'documentRevisionNumber']): 'DocumentFields',
-            frozenset(['settlementPeriodFrom', 'settlementPeriodTo']): 'SettlementPeriodRangeFields',
-            frozenset(['acceptanceNumber', 'acceptanceTime']): 'AcceptanceFields',
-            frozenset(['bidPrice', 'offerPrice']): 'BidOfferPriceFields',
-            frozenset(['bidVolume', 'offerVolume']): 'BidOfferVolumeFields',
-            frozenset(['bidPrice', 'bidVolume', 'offerPrice', 'offerVolume']): 'BidOfferFields',
-            frozenset(['minimumPossible', 'maximumAvailable']): 'CapacityFields',
-        }
-        
-        # Map single fields to field mixin classes (comprehensive set from schema analysis)
-        self.single_field_mixin_map = {
-            'dataset': 'DatasetFields',
-            'publishTime': 'PublishTimeFields',
-            'startTime': 'StartTimeFields',
-            'quantity': 'QuantityFields',
-            'year': 'YearFields',
-            'forecastDate': 'ForecastDateFields',
-            'demand': 'DemandFields',
-            'psrType': 'PsrTypeFields',
-            'fuelType': 'FuelTypeFields',
-            'boundary': 'BoundaryFields',
-            'businessType': 'BusinessTypeFields',
-            'generation': 'GenerationFields',
-            'volume': 'VolumeFields',
-            'outputUsable': 'OutputUsableFields',
-            'revisionNumber': 'RevisionNumberFields',
-            'week': 'WeekFields',
-            'assetId': 'AssetFields',
-            'createdDateTime': 'CreatedDateTimeFields',
-            'flowDirection': 'FlowDirectionFields',
-            'messageType': 'MessageTypeFields',
-            'biddingZone': 'BiddingZoneFields',
-            'id': 'IdFields',
-            'transmissionSystemDemand': 'TransmissionDemandFields',
-            'margin': 'MarginFields',
-            'soFlag': 'SoFlagFields',
-            'storFlag': 'StorFlagFields',
-            'bmUnitType': 'BmUnitTypeFields',
-            'leadPartyName': 'LeadPartyFields',
-            'nationalDemand': 'NationalDemandFields',
-            'surplus': 'SurplusFields',
-            'systemZone': 'SystemZoneFields',
-            'interconnectorName': 'InterconnectorFields',
-            'amendmentFlag': 'AmendmentFlagFields',
-            'activeFlag': 'ActiveFlagFields',
-            'time': 'TimeFields',
-        }
-        
-        # Map field names to their enum types
-        self.field_to_enum = {
-            'dataset': 'DatasetEnum',
-            'psrType': 'PsrtypeEnum',
-            'fuelType': 'FueltypeEnum',
-            'businessType': 'BusinesstypeEnum',
-            'messageType': 'MessagetypeEnum',
-            'eventType': 'EventtypeEnum',
-            'processType': 'ProcesstypeEnum',
-            'warningType': 'WarningtypeEnum',
-            'assetType': 'AssettypeEnum',
-            'eventStatus': 'EventstatusEnum',
-            'unavailabilityType': 'UnavailabilitytypeEnum',
-            'flowDirection': 'FlowdirectionEnum',
-            'tradeDirection': 'TradedirectionEnum',
-            'marketAgreementType': 'MarketagreementtypeEnum',
-            'boundary': 'BoundaryEnum',
-            'recordType': 'RecordtypeEnum',
-            'deliveryMode': 'DeliverymodeEnum',
-            'settlementRunType': 'SettlementruntypeEnum',
-            'bmUnitType': 'BmunittypeEnum',
-            'priceDerivationCode': 'PricederivationcodeEnum',
-            'systemZone': 'SystemzoneEnum',
-            'amendmentFlag': 'AmendmentflagEnum',
-        }
-        
-        # Fields that should be inferred as required (not optional)
-        # Based on BMRS API usage patterns - these are fields that are
-        # consistently present in API responses
-        self.inferred_required_fields = {
-            # Core identification fields - ALWAYS present
-            'dataset', 'documentId', 'publishTime', 'settlementDate', 'settlementPeriod',
-            'startTime', 'timeFrom', 'measurementTime', 'createdDateTime',
-            'halfHourEndTime', 'messageReceivedDateTime', 'documentRevisionNumber',
-            'timeSeriesId', 'mrid', 'mRID', 'createdTime',
-            
-            # Settlement period ranges
-            'settlementPeriodFrom', 'settlementPeriodTo',
-            
-            # BM Unit identification - present when relevant
-            'bmUnit', 'nationalGridBmUnit', 'nationalGridBmUnitId', 'bmUnitType',
-            
-            # Core data fields - the actual data values
-            'quantity', 'generation', 'demand', 'price', 'cost', 'volume',
-            'frequency', 'temperature', 'transmissionSystemDemand', 'nationalDemand',
-            'outputUsable', 'margin', 'surplus', 'imbalance',
-            
-            # Status and type fields - classification data
-            'businessType', 'psrType', 'fuelType', 'messageType', 'processType',
-            'warningType', 'messageHeading', 'eventType', 'unavailabilityType',
-            'assetType', 'eventStatus', 'amendmentFlag',
-            
-            # ID fields - identifiers
-            'id', 'acceptanceNumber', 'pairId', 'acceptanceId',
-            'participantId', 'assetId', 'affectedUnit', 'demandControlId',
-            'bidId', 'sequenceId', 'messageId',
-            
-            # Direction and flow fields
-            'flowDirection', 'tradeDirection',
-            
-            # Contract and market fields
-            'marketAgreementType', 'contractIdentification',
-            
-            # Trade fields
-            'tradeQuantity', 'tradePrice', 'traderUnit',
-            
-            # Capacity and limit fields that are typically present
-            'normalCapacity', 'availableCapacity', 'unavailableCapacity',
-            
-            # Time-related fields
-            'eventStartTime', 'eventEndTime', 'acceptanceTime',
-            'publishingPeriodCommencingTime',
-            
-            # Location/zone fields
-            'affectedArea', 'biddingZone', 'systemZone', 'interconnectorName',
-            
-            # Forecast fields
-            'forecastDate', 'forecastWeek', 'forecastYear', 'weekStartDate',
-            'calendarWeekNumber',
-            
-            # Other commonly required fields
-            'cause', 'revisionNumber', 'affectedDso',
-            'instructionSequence', 'demandControlEventFlag',
-            'leadPartyName', 'leadPartyId', 'gspGroupId',
-            'minimumPossible', 'maximumAvailable',
-            'amount', 'energyPrice', 'procurementPrice',
-        }
 
     def sanitize_class_name(self, name: str, original_name: str = None) -> str:
         """
@@ -218,38 +446,7 @@ class PydanticModelGenerator:
         Returns:
             Sanitized class name with suffix if needed
         """
-        original_name = original_name or name
-        
-        # Detect wrapper types and add descriptive suffixes
-        # This resolves duplicate class names from generic wrapper types
-        suffix = ""
-        if "DatasetResponse-1_" in original_name:
-            suffix = "_DatasetResponse"
-        elif "ResponseWithMetadata-1_" in original_name:
-            suffix = "_ResponseWithMetadata"
-        elif "Response-1_" in original_name and "-1_" in original_name:
-            suffix = "_Response"
-        
-        # Remove namespace prefixes (e.g., "Insights.Api.Models.")
-        name = name.split(".")[-1]
-        
-        # Replace invalid characters
-        name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-        
-        # Remove consecutive underscores
-        name = re.sub(r"_+", "_", name)
-        
-        # Ensure it starts with a letter
-        if name and name[0].isdigit():
-            name = f"Model_{name}"
-        
-        # Remove leading/trailing underscores
-        name = name.strip("_")
-        
-        # Add suffix for wrapper types
-        result = (name + suffix) if suffix else name
-        
-        return result or "UnnamedModel"
+        return _sanitize_class_name(name, original_name or name)
 
     def sanitize_field_name(self, name: str) -> str:
         """
@@ -261,30 +458,10 @@ class PydanticModelGenerator:
         Returns:
             Sanitized field name in snake_case (e.g., 'publish_time', 'bm_unit')
         """
-        # Convert camelCase to snake_case
-        # Insert underscore before uppercase letters that follow lowercase letters
-        name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name)
-        # Convert to lowercase
-        name = name.lower()
-        
-        # Replace invalid characters
-        name = re.sub(r"[^a-z0-9_]", "_", name)
-        
-        # Python keywords need underscore suffix
-        python_keywords = {
-            'from', 'to', 'in', 'is', 'or', 'and', 'not', 'if', 'else',
-            'for', 'while', 'def', 'class', 'return', 'import', 'as'
-        }
-        
-        if name in python_keywords:
-            name = f"{name}_"
-        
-        # Remove consecutive underscores
-        name = re.sub(r"_+", "_", name)
-        
-        return name.strip("_") or "field"
+        return _sanitize_field_name(name)
 
-    def get_python_type(self, schema: Dict[str, Any], required: bool = False, field_name: str = None) -> str:
+    def get_python_type(self, schema: Dict[str, Any], required: bool = False, field_name: str = None,
+                        force_non_nullable: bool = False) -> str:
         """
         Convert OpenAPI schema to Python type hint.
 
@@ -292,19 +469,21 @@ class PydanticModelGenerator:
             schema: OpenAPI schema definition
             required: Whether the field is required
             field_name: Name of the field (used for enum lookup)
+            force_non_nullable: Ignore the schema's ``nullable`` flag
 
         Returns:
             Python type hint string
         """
+        enum_type = self.FIELD_TO_ENUM.get(field_name) if field_name else None
+        ref_path = schema.get("$ref")
+
         # Check if this field should use an enum
-        if field_name and field_name in self.field_to_enum:
-            enum_type = self.field_to_enum[field_name]
+        if enum_type:
             # Mark that we use enums
             self.uses_enums = True
             type_hint = enum_type
         # Handle $ref references
-        elif "$ref" in schema:
-            ref_path = schema["$ref"]
+        elif ref_path is not None:
             ref_name = ref_path.split("/")[-1]
             class_name = self.sanitize_class_name(ref_name, original_name=ref_name)
             type_hint = class_name
@@ -313,16 +492,15 @@ class PydanticModelGenerator:
             items = schema.get("items", {})
             item_type = self.get_python_type(items, required=True, field_name=field_name)
             type_hint = f"List[{item_type}]"
-        # Handle nullable fields
-        elif schema.get("nullable") or not required:
-            base_type = self._get_base_type(schema, field_name=field_name)
-            return f"Optional[{base_type}]"
         else:
             type_hint = self._get_base_type(schema, field_name=field_name)
+            # Handle nullable fields
+            if schema.get("nullable") and not force_non_nullable:
+                return f"Optional[{type_hint}]"
 
         # Make optional if not required
-        if not required and not type_hint.startswith("Optional"):
-            type_hint = f"Optional[{type_hint}]"
+        if not required:
+            return f"Optional[{type_hint}]"
 
         return type_hint
 
@@ -331,6 +509,11 @@ class PydanticModelGenerator:
         schema_type = schema.get("type", "string")
         schema_format = schema.get("format")
 
+        # Common (type, format) pairs resolve in a single lookup
+        base_type = self._BASE_TYPE_DISPATCH.get((schema_type, schema_format))
+        if base_type is not None:
+            return base_type
+
         # Check format first
         if schema_format and schema_format in self.FORMAT_MAPPING:
             return self.FORMAT_MAPPING[schema_format]
@@ -354,15 +537,17 @@ class PydanticModelGenerator:
         
         # Order matters: more specific mixins first, then general ones
         
-        # Check for field combinations that have field mixins
-        for field_combo, mixin_name in self.field_mixin_map.items():
-            if field_combo.issubset(field_names):
-                mixins.append(mixin_name)
-                fields_to_skip.update(field_combo)
-                self.uses_field_mixins = True
+        # Check for field combinations that have field mixins (most models
+        # have none of the combination fields, so skip the scan for those)
+        if not field_names.isdisjoint(self._COMBO_TRIGGER_FIELDS):
+            for field_combo, mixin_name in self.FIELD_MIXIN_MAP.items():
+                if field_combo <= field_names:
+                    mixins.append(mixin_name)
+                    fields_to_skip.update(field_combo)
+                    self.uses_field_mixins = True
         
         # Check for single fields that have field mixins
-        for field_name, mixin_name in self.single_field_mixin_map.items():
+        for field_name, mixin_name in self.SINGLE_FIELD_MIXIN_MAP.items():
             if field_name in field_names and field_name not in fields_to_skip:
                 mixins.append(mixin_name)
                 fields_to_skip.add(field_name)
@@ -370,223 +555,16 @@ class PydanticModelGenerator:
         
         # Now add validator mixins (methods only, no fields)
         # These are for fields NOT covered by field mixins
-        
-        # Settlement date without period
-        if 'settlementDate' in field_names and 'settlementDate' not in fields_to_skip:
-            mixins.append('SettlementDateMixin')
-            self.uses_validators = True
-        
-        # Single field mixins (alphabetically)
-        
-        # Acceptance (3+ models)
-        if 'acceptanceNumber' in field_names:
-            mixins.append('AcceptanceMixin')
-            self.uses_validators = True
-        
-        # Affected unit (4 models)
-        if 'affectedUnit' in field_names:
-            mixins.append('AffectedUnitMixin')
-            self.uses_validators = True
-        
-        # Asset (6+ models)
-        if 'assetId' in field_names:
-            mixins.append('AssetMixin')
-            self.uses_validators = True
-        
-        # Bid/Offer (multiple models)
-        if 'bid' in field_names and 'offer' in field_names:
-            mixins.append('BidOfferMixin')
-            self.uses_validators = True
-        
-        # BM Unit fields (22+ models)
-        if 'bmUnit' in field_names or 'nationalGridBmUnit' in field_names:
-            mixins.append('BmUnitMixin')
-            self.uses_validators = True
-        
-        # Business type (10 models)
-        if 'businessType' in field_names:
-            mixins.append('BusinessTypeMixin')
-            self.uses_validators = True
-        
-        # Capacity (multiple models)
-        if 'normalCapacity' in field_names or 'availableCapacity' in field_names:
-            mixins.append('CapacityMixin')
-            self.uses_validators = True
-        
-        # Created date time (6 models)
-        if 'createdDateTime' in field_names:
-            mixins.append('CreatedDateTimeMixin')
-            self.uses_validators = True
-        
-        # Dataset (many models)
-        if 'dataset' in field_names:
-            mixins.append('DatasetMixin')
-            self.uses_validators = True
-        
-        # Event (4 models)
-        if 'eventType' in field_names and 'eventStatus' in field_names:
-            mixins.append('EventMixin')
-            self.uses_validators = True
-        
-        # Event time (multiple models)
-        if 'eventStartTime' in field_names and 'eventEndTime' in field_names:
-            mixins.append('EventTimeMixin')
-            self.uses_validators = True
-        
-        # Flags (multiple models)
-        if any(f in field_names for f in ['deemedBoFlag', 'soFlag', 'storFlag', 'rrFlag']):
-            mixins.append('FlagsMixin')
-            self.uses_validators = True
-        
-        # Flow direction (6+ models) - includes validation
-        if 'flowDirection' in field_names:
-            mixins.append('FlowDirectionMixin')
-            self.uses_validators = True
-        
-        # Fuel type (12 models)
-        if 'fuelType' in field_names:
-            mixins.append('FuelTypeMixin')
-            self.uses_validators = True
-        
-        # Lead party (multiple models)
-        if 'leadPartyName' in field_names:
-            mixins.append('LeadPartyMixin')
-            self.uses_validators = True
-        
-        # Message (4 models)
-        if 'messageHeading' in field_names and 'messageType' in field_names:
-            mixins.append('MessageMixin')
-            self.uses_validators = True
-        
-        # MRID (3+ models)
-        if 'mrid' in field_names or 'mRID' in field_names:
-            mixins.append('MridMixin')
-            self.uses_validators = True
-        
-        # Pair ID (multiple models)
-        if 'pairId' in field_names:
-            mixins.append('PairIdMixin')
-            self.uses_validators = True
-        
-        # Participant (3+ models)
-        if 'participantId' in field_names:
-            mixins.append('ParticipantMixin')
-            self.uses_validators = True
-        
-        # Volume (8 models)
-        if 'volume' in field_names:
-            mixins.append('VolumeMixin')
-            self.uses_validators = True
-        
-        # Cost (3+ models)
-        if 'cost' in field_names:
-            mixins.append('CostMixin')
-            self.uses_validators = True
-        
-        # Demand (3+ models)
-        if 'demand' in field_names:
-            mixins.append('DemandMixin')
-            self.uses_validators = True
-        
-        # Generation (3+ models)
-        if 'generation' in field_names:
-            mixins.append('GenerationMixin')
-            self.uses_validators = True
-        
-        # Margin (5 models)
-        if 'margin' in field_names:
-            mixins.append('MarginMixin')
-            self.uses_validators = True
-        
-        # Surplus (4 models)
-        if 'surplus' in field_names:
-            mixins.append('SurplusMixin')
-            self.uses_validators = True
-        
-        # Imbalance (multiple models)
-        if 'imbalance' in field_names:
-            mixins.append('ImbalanceMixin')
-            self.uses_validators = True
-        
-        # Frequency (multiple models)
-        if 'frequency' in field_names:
-            mixins.append('FrequencyMixin')
-            self.uses_validators = True
-        
-        # Temperature (multiple models)
-        if 'temperature' in field_names:
-            mixins.append('TemperatureMixin')
-            self.uses_validators = True
-        
-        # Year (14 models)
-        if 'year' in field_names:
-            mixins.append('YearMixin')
-            self.uses_validators = True
-        
-        # Week (7 models)
-        if 'week' in field_names:
-            mixins.append('WeekMixin')
-            self.uses_validators = True
-        
-        # Month (multiple models)
-        if 'month' in field_names:
-            mixins.append('MonthMixin')
-            self.uses_validators = True
-        
-        # Forecast date (13 models)
-        if 'forecastDate' in field_names:
-            mixins.append('ForecastDateMixin')
-            self.uses_validators = True
-        
-        # Boundary (10 models)
-        if 'boundary' in field_names:
-            mixins.append('BoundaryMixin')
-            self.uses_validators = True
-        
-        # Output usable (8 models)
-        if 'outputUsable' in field_names:
-            mixins.append('OutputUsableMixin')
-            self.uses_validators = True
-        
-        # Bidding zone (5 models)
-        if 'biddingZone' in field_names:
-            mixins.append('BiddingZoneMixin')
-            self.uses_validators = True
-        
-        # Interconnector (4 models)
-        if 'interconnectorName' in field_names:
-            mixins.append('InterconnectorMixin')
-            self.uses_validators = True
-        
-        # Price (50+ models)
-        if 'price' in field_names:
-            mixins.append('PriceMixin')
-            self.uses_validators = True
-        
-        # PSR type (13 models)
-        if 'psrType' in field_names:
-            mixins.append('PsrTypeMixin')
-            self.uses_validators = True
-        
-        # Publish time (86 models)
-        if 'publishTime' in field_names:
-            mixins.append('PublishTimeMixin')
-            self.uses_validators = True
-        
-        # Quantity (80+ models)
-        if 'quantity' in field_names:
-            mixins.append('QuantityMixin')
-            self.uses_validators = True
-        
-        # Revision number (7 models)
-        if 'revisionNumber' in field_names:
-            mixins.append('RevisionMixin')
-            self.uses_validators = True
-        
-        # Start time (56 models) - only if not already in field mixin
-        if 'startTime' in field_names and 'startTime' not in fields_to_skip:
-            mixins.append('StartTimeMixin')
-            self.uses_validators = True
+        uncovered = field_names - fields_to_skip
+        for mixin_name, triggers, match_all, uncovered_only in self._VALIDATOR_MIXIN_RULES:
+            candidates = uncovered if uncovered_only else field_names
+            if match_all:
+                matched = triggers <= candidates
+            else:
+                matched = not triggers.isdisjoint(candidates)
+            if matched:
+                mixins.append(mixin_name)
+                self.uses_validators = True
         
         return mixins, fields_to_skip
 
@@ -599,8 +577,25 @@ class PydanticModelGenerator:
             schema: Schema definition
 
         Returns:
-            Generated Python class code
+            Generated Python class code (newline-terminated), or an empty
+            string for composition schemas that are skipped
         """
+        class_name = self._name_map.get(name)
+        if class_name is None:
+            class_name = self._name_map[name] = self._claim_class_name(name)
+        return self._render_model(class_name, schema)
+
+    def _assign_class_names(self) -> None:
+        """Claim a class name for every schema up front, in sorted schema order."""
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.schemas)
+        name_map = self._name_map
+        for name in self._sorted_keys:
+            if name not in name_map:
+                name_map[name] = self._claim_class_name(name)
+
+    def _claim_class_name(self, name: str) -> str:
+        """Pick the class name for a schema, resolving collisions in call order."""
         class_name = self.sanitize_class_name(name, original_name=name)
         
         # Handle any remaining name collisions with numeric suffix
@@ -615,7 +610,10 @@ class PydanticModelGenerator:
             class_name = f"{class_name}_{self.class_name_counts[class_name]}"
         
         self.generated_models.add(class_name)
+        return class_name
 
+    def _render_model(self, class_name: str, schema: Dict[str, Any]) -> str:
+        """Generate the code for a schema under an already chosen class name."""
         # Get properties and required fields
         properties = schema.get("properties", {})
         required_fields = set(schema.get("required", []))
@@ -632,22 +630,21 @@ class PydanticModelGenerator:
         # Detect which mixins to apply and which fields to skip
         mixins, fields_to_skip = self._detect_mixins(properties)
 
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
         # Build class definition with mixins
         if mixins:
             base_classes = ', '.join(mixins + ['BaseModel'])
-            lines.append(f"class {class_name}({base_classes}):")
+            write(f"class {class_name}({base_classes}):\n")
         else:
-            lines.append(f"class {class_name}(BaseModel):")
+            write(f"class {class_name}(BaseModel):\n")
         
         # Add docstring
         if description:
-            lines.append(f'    """{description}"""')
-            lines.append("")
+            write(f'    """{description}"""\n\n')
 
         # Add config - allow both snake_case and camelCase field names
-        lines.append("    model_config = ConfigDict(extra='allow', populate_by_name=True)")
-        lines.append("")
+        write("    model_config = ConfigDict(extra='allow', populate_by_name=True)\n\n")
 
         # Generate fields (skip fields provided by field mixins)
         if properties:
@@ -659,130 +656,165 @@ class PydanticModelGenerator:
                 safe_field_name = self.sanitize_field_name(field_name)
                 # Check both OpenAPI required fields AND our inferred required fields
                 # Override nullable if field is in our inferred required list
-                is_required = field_name in required_fields or field_name in self.inferred_required_fields
+                inferred_required = field_name in self.INFERRED_REQUIRED_FIELDS
+                is_required = inferred_required or field_name in required_fields
                 
-                # Override the schema's nullable setting if we've inferred it's required
-                if field_name in self.inferred_required_fields:
-                    # Create a copy to avoid modifying the original
-                    field_schema = field_schema.copy()
-                    field_schema['nullable'] = False
-                
-                type_hint = self.get_python_type(field_schema, required=is_required, field_name=field_name)
-                field_description = field_schema.get("description", "")
-                example = field_schema.get("example")
+                type_hint = self.get_python_type(field_schema, required=is_required, field_name=field_name,
+                                                 force_non_nullable=inferred_required)
 
-                # Build field definition
-                field_params = []
-                
+                # Generate field line
                 # Always add alias if field name changed (for snake_case conversion)
                 if safe_field_name != field_name:
-                    field_params.append(f'alias="{field_name}"')
+                    write(f"    {safe_field_name}: {type_hint} = Field(")
+                    if not is_required:
+                        write("default=None, ")
+                    write(_format_alias(field_name))
                     
+                    # Description and example are only emitted alongside the alias
+                    field_description = field_schema.get("description")
+                    example = field_schema.get("example")
                     if field_description:
-                        field_params.append(f'description="{field_description}"')
+                        write(_format_description(field_description))
                     if example is not None:
                         if isinstance(example, str):
-                            field_params.append(f'examples=["{example}"]')
+                            write(f', examples=["{example}"]')
                         else:
-                            field_params.append(f'examples=[{example}]')
-                    
-                # Generate field line
-                if field_params:
-                    if not is_required:
-                        lines.append(f"    {safe_field_name}: {type_hint} = Field(default=None, {', '.join(field_params)})")
-                    else:
-                        lines.append(f"    {safe_field_name}: {type_hint} = Field({', '.join(field_params)})")
+                            write(f', examples=[{example}]')
+                    write(")\n")
                 else:
                     if not is_required:
-                        lines.append(f"    {safe_field_name}: {type_hint} = None")
+                        write(f"    {safe_field_name}: {type_hint} = None\n")
                     else:
-                        lines.append(f"    {safe_field_name}: {type_hint}")
+                        write(f"    {safe_field_name}: {type_hint}\n")
 
         else:
             # No properties, add pass
-            lines.append("    pass")
+            write("    pass\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
-    def generate_all_models(self) -> str:
+    def _generate_models(self, jobs: int = 1) -> Iterator[str]:
         """
-        Generate all Pydantic models from the spec.
+        Generate the code for every schema, in sorted schema-name order.
 
-        Returns:
-            Complete Python code for all models
+        Args:
+            jobs: Number of worker processes; 1 generates in this process
         """
-        models = []
-
-        # Sort schemas for consistent output
-        sorted_schemas = sorted(self.schemas.items())
-
-        for name, schema in sorted_schemas:
-            model_code = self.generate_model(name, schema)
-            if model_code:
-                models.append(model_code)
+        # Class names depend on the order schemas are visited, so they are all
+        # assigned first (sorted for consistent output); rendering then only
+        # looks them up
+        self._assign_class_names()
+        name_map = self._name_map
+
+        if jobs <= 1:
+            schemas = self.schemas
+            for name in self._sorted_keys:
+                yield self._render_model(name_map[name], schemas[name])
+            return
+
+        # Workers only render; their usage flags are folded back in here
+        tasks = [(name, name_map[name]) for name in self._sorted_keys]
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(self.spec,)
+        ) as executor:
+            results = executor.map(_render_model_in_worker, tasks, chunksize=16)
+            for model_code, uses_enums, uses_validators, uses_field_mixins in results:
+                self.uses_enums |= uses_enums
+                self.uses_validators |= uses_validators
+                self.uses_field_mixins |= uses_field_mixins
+                yield model_code
+
+    def generate_all_models(self, fp: TextIO, jobs: int = 1) -> int:
+        """
+        Write all Pydantic models from the spec.
 
-        # Build header with succinct imports
-        header = '''"""
-Auto-generated Pydantic models from BMRS OpenAPI specification.
+        The header's imports depend on which enums and mixins the models
+        use, so every model is generated before anything is written; the
+        models are then written to ``fp`` one at a time rather than being
+        joined into a single string.
 
-This file is automatically generated. Do not edit manually.
-"""
+        Args:
+            fp: Open text file to write the generated module to
+            jobs: Number of worker processes to generate models with
 
-from __future__ import annotations  # Enable forward references
+        Returns:
+            Number of models written
+        """
+        models = [model_code for model_code in self._generate_models(jobs) if model_code]
 
-from typing import Any, Dict, List, Optional, Union
-from datetime import date, datetime
-from pydantic import BaseModel, Field, ConfigDict
-'''
+        write = fp.write
+        # Build header with succinct imports
+        write(_MODELS_HEADER)
         
         # Add enum and validator imports if used (succinct module imports)
         if self.uses_enums:
-            header += "from elexon_bmrs import enums\n"
+            write("from elexon_bmrs import enums\n")
         if self.uses_validators:
-            header += "from elexon_bmrs import validators\n"
+            write("from elexon_bmrs import validators\n")
         if self.uses_field_mixins:
-            header += "from elexon_bmrs import field_mixins\n"
+            write("from elexon_bmrs import field_mixins\n")
         
-        header += "\n"
+        write("\n")
         
         # Add convenience aliases for field mixins
         if self.uses_field_mixins:
-            header += "\n# Field mixin aliases (provide field definitions + methods)\n"
-            all_field_mixins = set(self.field_mixin_map.values()) | set(self.single_field_mixin_map.values())
-            for mixin in sorted(all_field_mixins):
-                header += f"{mixin} = field_mixins.{mixin}\n"
+            write("\n# Field mixin aliases (provide field definitions + methods)\n")
+            write("".join(f"{mixin} = field_mixins.{mixin}\n" for mixin in self._FIELD_MIXIN_ALIASES))
         
         # Add convenience aliases for commonly used types
         if self.uses_enums:
-            header += "\n# Enum type aliases for convenience\n"
-            for field_name, enum_type in sorted(self.field_to_enum.items()):
-                header += f"{enum_type} = enums.{enum_type}\n"
+            write("\n# Enum type aliases for convenience\n")
+            write("".join(f"{enum_type} = enums.{enum_type}\n" for _, enum_type in sorted(self.FIELD_TO_ENUM.items())))
         
         if self.uses_validators:
-            header += "\n# Validator mixin aliases for convenience\n"
-            validator_mixins = [
-                'SettlementPeriodMixin', 'SettlementDateMixin', 'TimeRangeMixin', 'LevelRangeMixin',
-                'PublishTimeMixin', 'StartTimeMixin', 'DocumentMixin', 'DatasetMixin',
-                'FlowDirectionMixin', 'BmUnitMixin', 'QuantityMixin', 'PriceMixin',
-                'FuelTypeMixin', 'PsrTypeMixin', 'BusinessTypeMixin', 'CreatedDateTimeMixin',
-                'RevisionMixin', 'AssetMixin', 'MessageMixin', 'EventMixin', 'EventTimeMixin',
-                'AffectedUnitMixin', 'ParticipantMixin', 'AcceptanceMixin', 'BidOfferMixin',
-                'PairIdMixin', 'FlagsMixin', 'CapacityMixin', 'LeadPartyMixin', 'MridMixin',
-                'VolumeMixin', 'CostMixin', 'DemandMixin', 'GenerationMixin', 'MarginMixin',
-                'SurplusMixin', 'ImbalanceMixin', 'FrequencyMixin', 'TemperatureMixin',
-                'YearMixin', 'WeekMixin', 'MonthMixin', 'ForecastDateMixin', 'BoundaryMixin',
-                'OutputUsableMixin', 'BiddingZoneMixin', 'InterconnectorMixin'
-            ]
-            for mixin in validator_mixins:
-                header += f"{mixin} = validators.{mixin}\n"
+            write("\n# Validator mixin aliases for convenience\n")
+            write("".join(f"{mixin} = validators.{mixin}\n" for mixin in _VALIDATOR_MIXINS))
         
-        header += "\n\n"
+        write("\n\n")
+
+        # Models are separated by two blank lines
+        for index, model_code in enumerate(models):
+            if index:
+                write("\n\n")
+            write(model_code)
+        if not models:
+            write("\n")
+
+        return len(models)
+
+
+# Per-process generator used when generating models in parallel
+_worker_generator: Optional[PydanticModelGenerator] = None
 
-        return header + "\n\n\n".join(models) + "\n"
 
+def _init_worker(spec: dict) -> None:
+    """Build the generator once in each worker process."""
+    global _worker_generator
+    _worker_generator = PydanticModelGenerator(spec)
 
-def main() -> int:
+
+def _render_model_in_worker(task: Tuple[str, str]) -> Tuple[str, bool, bool, bool]:
+    """Render one model in a worker, returning (code, uses_enums, uses_validators, uses_field_mixins)."""
+    name, class_name = task
+    generator = _worker_generator
+    generator.uses_enums = generator.uses_validators = generator.uses_field_mixins = False
+    model_code = generator._render_model(class_name, generator.schemas[name])
+    return model_code, generator.uses_enums, generator.uses_validators, generator.uses_field_mixins
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description="Generate Pydantic models from the BMRS OpenAPI spec"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for model generation (default: 1; only worth it for very large specs)",
+    )
+    args = parser.parse_args(argv)
+
     print("\n╔" + "=" * 58 + "╗")
     print("║" + " " * 15 + "BMRS Model Generator" + " " * 23 + "║")
     print("╚" + "=" * 58 + "╝\n")
@@ -797,8 +829,11 @@ def main() -> int:
         return 1
 
     print(f"Loading OpenAPI spec from: {spec_path}")
-    with open(spec_path, "r", encoding="utf-8") as f:
-        spec = json.load(f)
+    if orjson is not None:
+        spec = orjson.loads(spec_path.read_bytes())
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
 
     # Handle spec wrapped in array
     if isinstance(spec, list):
@@ -812,12 +847,11 @@ def main() -> int:
     # Generate models
     print("Generating Pydantic models...")
     generator = PydanticModelGenerator(spec)
-    models_code = generator.generate_all_models()
 
-    # Save generated models
+    # Write generated models straight to the output file
     output_path = script_dir.parent / "elexon_bmrs" / "generated_models.py"
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(models_code)
+        generator.generate_all_models(f, jobs=args.jobs)
 
     print(f"✓ Generated models saved to: {output_path}")
 
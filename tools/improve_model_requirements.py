@@ -5,16 +5,25 @@ This script analyzes the generated models and makes educated guesses about
 which fields should be required based on common patterns and field names.
 """
 
-import re
+import hashlib
+import inspect
+import io
+import os
 from pathlib import Path
 from typing import Set, Dict, List
 
 
+# Fingerprint of the last models file written, stored next to that file
+CACHE_FILENAME = '.improve_cache'
+
+
 class ModelRequirementAnalyzer:
     """Analyze and improve model field requirements."""
     
+    __slots__ = ('required_fields', 'optional_fields')
+    
     # Fields that are commonly required based on BMRS API patterns
-    COMMONLY_REQUIRED_FIELDS = {
+    COMMONLY_REQUIRED_FIELDS = frozenset({
         # Core identification fields
         'dataset', 'documentId', 'publishTime', 'settlementDate', 'settlementPeriod',
         
@@ -33,10 +42,10 @@ class ModelRequirementAnalyzer:
         
         # ID fields
         'id', 'mrid', 'acceptanceNumber', 'pairId', 'timeSeriesId',
-    }
+    })
     
     # Fields that are commonly optional (nullable/empty values expected)
-    COMMONLY_OPTIONAL_FIELDS = {
+    COMMONLY_OPTIONAL_FIELDS = frozenset({
         # Description and metadata
         'description', 'relatedInformation', 'messageText', 'warningText',
         
@@ -55,34 +64,33 @@ class ModelRequirementAnalyzer:
         
         # Optional location/area fields
         'area', 'zone', 'boundary', 'region', 'gspGroupId', 'gspGroupName',
-    }
+    })
+    
+    # Case-insensitive name endings that suggest optional fields
+    OPTIONAL_SUFFIXES = (
+        'flag', 'percentage', 'ratio', 'adjustment', 'optional', 'available',
+        'unavailable', 'specified', 'minimum', 'maximum', 'average', 'total', 'net',
+    )
+    
+    # Case-insensitive substrings that suggest optional fields anywhere in the name
+    OPTIONAL_SUBSTRINGS = ('secondary', 'reference', 'effective', 'amendment')
     
-    # Field name patterns that suggest optional fields
-    OPTIONAL_PATTERNS = [
-        r'.*Flag$',           # *_flag fields
-        r'.*Percentage$',     # *_percentage fields  
-        r'.*Ratio$',          # *_ratio fields
-        r'.*Adjustment$',     # *_adjustment fields
-        r'.*Optional$',       # *_optional fields
-        r'.*Available$',      # *_available fields
-        r'.*Unavailable$',    # *_unavailable fields
-        r'.*Specified$',      # *_specified fields
-        r'.*Minimum$',        # *_minimum fields
-        r'.*Maximum$',        # *_maximum fields
-        r'.*Average$',        # *_average fields
-        r'.*Total$',          # *_total fields
-        r'.*Net$',            # *_net fields
-        r'.*Secondary.*',     # secondary_* fields
-        r'.*Reference.*',     # reference_* fields
-        r'.*Effective.*',     # effective_* fields
-        r'.*Amendment.*',     # amendment_* fields
-    ]
+    # Fields always treated as optional on dataset row/response models
+    DATASET_OPTIONAL_FIELDS = frozenset({'description', 'relatedInformation', 'amendmentFlag'})
     
     def __init__(self):
         """Initialize the analyzer."""
         self.required_fields: Dict[str, Set[str]] = {}
         self.optional_fields: Dict[str, Set[str]] = {}
     
+    @classmethod
+    def _is_optional_name(cls, field_name: str) -> bool:
+        """Return True if the field name matches an optional suffix or substring."""
+        name = field_name.lower()
+        if name.endswith(cls.OPTIONAL_SUFFIXES):
+            return True
+        return any(part in name for part in cls.OPTIONAL_SUBSTRINGS)
+    
     def analyze_field_name(self, field_name: str) -> bool:
         """
         Analyze a field name to determine if it should be required.
@@ -101,10 +109,9 @@ class ModelRequirementAnalyzer:
         if field_name in self.COMMONLY_OPTIONAL_FIELDS:
             return False
             
-        # Check against optional patterns
-        for pattern in self.OPTIONAL_PATTERNS:
-            if re.match(pattern, field_name, re.IGNORECASE):
-                return False
+        # Check against optional name patterns
+        if self._is_optional_name(field_name):
+            return False
                 
         # Default to required for unknown fields (conservative approach)
         return True
@@ -120,22 +127,21 @@ class ModelRequirementAnalyzer:
         Returns:
             Dictionary mapping field names to required status
         """
-        field_requirements = {}
+        field_set = set(fields)
         
-        for field in fields:
-            # Special handling for certain model types
-            if 'DatasetRow' in class_name or 'DatasetResponse' in class_name:
-                # Dataset models often have more optional fields
-                if field in ['description', 'relatedInformation', 'amendmentFlag']:
-                    field_requirements[field] = False
-                else:
-                    field_requirements[field] = self.analyze_field_name(field)
-            elif 'Response' in class_name:
-                # Response models might have more required fields
-                field_requirements[field] = self.analyze_field_name(field)
-            else:
-                # Default analysis
-                field_requirements[field] = self.analyze_field_name(field)
+        # Same precedence as analyze_field_name: commonly required fields win,
+        # then commonly optional fields, then the optional name patterns
+        required = field_set & self.COMMONLY_REQUIRED_FIELDS
+        undecided = field_set - required - self.COMMONLY_OPTIONAL_FIELDS
+        is_optional_name = self._is_optional_name
+        required.update(field for field in undecided if not is_optional_name(field))
+        
+        # Special handling for certain model types
+        if 'DatasetRow' in class_name or 'DatasetResponse' in class_name:
+            # Dataset models often have more optional fields
+            required -= self.DATASET_OPTIONAL_FIELDS
+        
+        field_requirements = {field: field in required for field in fields}
         
         return field_requirements
     
@@ -152,72 +158,105 @@ class ModelRequirementAnalyzer:
         with open(models_file, 'r') as f:
             content = f.read()
         
-        # Parse existing models to extract field information
-        import ast
-        
-        # Simple parsing to extract class and field information
+        # Simple parsing to extract class and field information in a single
+        # pass. Lines are written straight to the output buffer, except each
+        # class's field lines, which are held back until the whole class has
+        # been seen and its field requirements are known.
         lines = content.split('\n')
-        improved_lines = []
+        line_count = len(lines)
+        buf = io.StringIO()
+        write = buf.write
         current_class = None
         current_fields = []
         
         i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        while i < line_count:
+            raw = lines[i]
+            line = raw.strip()
             
             # Detect class definition
             if line.startswith('class ') and '(' in line:
                 current_class = line.split()[1].split('(')[0]
-                improved_lines.append(lines[i])
+                write(raw)
+                write('\n')
                 i += 1
                 
                 # Skip docstring and config
-                while i < len(lines) and (lines[i].strip().startswith('"""') or 
-                                         'model_config' in lines[i] or
-                                         lines[i].strip() == ''):
-                    improved_lines.append(lines[i])
+                while i < line_count:
+                    raw = lines[i]
+                    stripped = raw.strip()
+                    if not (stripped.startswith('"""') or 'model_config' in raw or stripped == ''):
+                        break
+                    write(raw)
+                    write('\n')
                     i += 1
                 
-                # Parse fields
+                # Parse fields (indented lines, stopping at a nested class)
                 current_fields = []
-                while i < len(lines) and lines[i].startswith('    ') and not lines[i].startswith('    class '):
-                    field_line = lines[i].strip()
-                    if field_line and not field_line.startswith('#'):
+                field_line_indices = []
+                field_block = []
+                while i < line_count:
+                    raw = lines[i]
+                    if raw[:4] != '    ' or raw[:10] == '    class ':
+                        break
+                    field_line = raw.strip()
+                    if field_line and field_line[0] != '#':
                         # Extract field name
                         if ':' in field_line:
-                            field_name = field_line.split(':')[0].strip()
+                            field_name = field_line.split(':', 1)[0].strip()
                             current_fields.append(field_name)
-                    improved_lines.append(lines[i])
+                            field_line_indices.append(len(field_block))
+                    field_block.append(raw)
                     i += 1
                 
                 # Apply improved requirements to the fields we just processed
                 if current_fields:
                     requirements = self.analyze_model(current_class, current_fields)
                     
-                    # Go back and fix the field lines we just added
-                    field_start_idx = len(improved_lines) - len(current_fields)
-                    for j, field_name in enumerate(current_fields):
-                        line_idx = field_start_idx + j
-                        if line_idx < len(improved_lines):
-                            original_line = improved_lines[line_idx]
-                            if requirements.get(field_name, True):  # Default to required
-                                # Make field required (remove Optional and default=None)
-                                improved_line = original_line.replace('Optional[', '').replace(']', '')
-                                if '= None' in improved_line:
-                                    improved_line = improved_line.replace('= None', '')
-                                if '= Field(default=None' in improved_line:
-                                    improved_line = improved_line.replace('= Field(default=None, ', '= Field(')
-                                    if improved_line.endswith(')'):
-                                        improved_line = improved_line[:-1]
-                                improved_lines[line_idx] = improved_line
+                    # Fix the field lines we just collected
+                    for line_idx, field_name in zip(field_line_indices, current_fields):
+                        original_line = field_block[line_idx]
+                        if requirements.get(field_name, True):  # Default to required
+                            # Make field required (remove Optional and default=None)
+                            improved_line = original_line.replace('Optional[', '').replace(']', '')
+                            if '= None' in improved_line:
+                                improved_line = improved_line.replace('= None', '')
+                            if '= Field(default=None' in improved_line:
+                                improved_line = improved_line.replace('= Field(default=None, ', '= Field(')
+                                if improved_line.endswith(')'):
+                                    improved_line = improved_line[:-1]
+                            field_block[line_idx] = improved_line
+                
+                for raw in field_block:
+                    write(raw)
+                    write('\n')
                 
                 current_class = None
                 current_fields = []
             else:
-                improved_lines.append(lines[i])
+                write(raw)
+                write('\n')
                 i += 1
         
-        return '\n'.join(improved_lines)
+        # Every line was written with a trailing newline; drop the last one
+        buf.seek(buf.tell() - 1)
+        buf.truncate()
+        return buf.getvalue()
+
+
+def fingerprint(content: bytes) -> str:
+    """
+    Fingerprint a models file together with the analyzer's source.
+    
+    Args:
+        content: Raw contents of the models file
+        
+    Returns:
+        Hex digest that changes whenever the file or the analysis rules change
+    """
+    digest = hashlib.blake2b(content)
+    digest.update(inspect.getsource(ModelRequirementAnalyzer).encode())
+    return digest.hexdigest()
 
 
 def main():
@@ -234,6 +273,16 @@ def main():
         print(f"✗ Models file not found: {models_file}")
         return 1
     
+    # Skip the run if this is the file we last wrote and the rules are unchanged
+    cache_file = models_file.parent / CACHE_FILENAME
+    try:
+        cached_key = cache_file.read_text().strip()
+    except FileNotFoundError:
+        cached_key = None
+    if cached_key == fingerprint(models_file.read_bytes()):
+        print(f"✓ Models file already up to date: {models_file}")
+        return 0
+    
     print(f"Analyzing models file: {models_file}")
     
     # Analyze and improve models
@@ -246,8 +295,13 @@ def main():
     models_file.rename(backup_file)
     
     print(f"Saving improved models: {models_file}")
-    with open(models_file, 'w') as f:
-        f.write(improved_content)
+    models_file.write_text(improved_content, encoding='utf-8')
+    
+    # Record what was written; replace atomically so a crash never leaves a
+    # partial fingerprint behind
+    tmp_cache_file = cache_file.with_name(CACHE_FILENAME + '.tmp')
+    tmp_cache_file.write_text(fingerprint(models_file.read_bytes()))
+    os.replace(tmp_cache_file, cache_file)
     
     print("✓ Model requirements improved!")
     print("\nChanges made:")
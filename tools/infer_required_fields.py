@@ -7,9 +7,16 @@ are consistently present (and therefore should be required).
 
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, List, Any
-from collections import defaultdict
+from typing import Dict, Set, List, Any, Tuple
+from collections import Counter, defaultdict
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib encoder
+    orjson = None
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,10 +27,12 @@ from elexon_bmrs import BMRSClient
 class RequiredFieldInferrer:
     """Infer required fields from actual API responses."""
     
+    __slots__ = ('client', 'field_presence', 'total_responses')
+    
     def __init__(self, api_key: str = None):
         """Initialize with optional API key."""
         self.client = BMRSClient(api_key=api_key)
-        self.field_presence: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.field_presence: Dict[str, Counter] = defaultdict(Counter)
         self.total_responses: Dict[str, int] = defaultdict(int)
     
     def test_endpoint(self, endpoint_name: str, method_name: str, **kwargs) -> None:
@@ -35,8 +44,29 @@ class RequiredFieldInferrer:
             method_name: Client method name (e.g., 'get_datasets_abuc')
             **kwargs: Parameters to pass to the method
         """
+        row_count, field_counts = self.sample_endpoint(endpoint_name, method_name, **kwargs)
+        self.record_sample(endpoint_name, row_count, field_counts)
+    
+    def sample_endpoint(
+        self, endpoint_name: str, method_name: str, **kwargs
+    ) -> Tuple[int, Counter]:
+        """
+        Call an endpoint and count non-null fields in its first rows.
+        
+        Does not touch the inferrer's totals, so several endpoints can be
+        sampled concurrently and recorded afterwards with record_sample().
+        
+        Args:
+            endpoint_name: Name for tracking (e.g., 'abuc')
+            method_name: Client method name (e.g., 'get_datasets_abuc')
+            **kwargs: Parameters to pass to the method
+            
+        Returns:
+            Tuple of (rows sampled, non-null count per field name)
+        """
+        row_count = 0
+        field_counts: Counter = Counter()
         try:
-            print(f"Testing {endpoint_name}...", end=" ")
             method = getattr(self.client, method_name)
             response = method(**kwargs)
             
@@ -46,19 +76,31 @@ class RequiredFieldInferrer:
                     # Analyze each row
                     for row in data_list[:10]:  # Sample first 10 rows
                         if isinstance(row, dict):
-                            self.total_responses[endpoint_name] += 1
-                            for field_name, field_value in row.items():
-                                if field_value is not None:
-                                    self.field_presence[endpoint_name][field_name] += 1
+                            row_count += 1
+                            field_counts.update(
+                                field_name for field_name, field_value in row.items()
+                                if field_value is not None
+                            )
                     
-                    print(f"✓ ({len(data_list)} rows)")
+                    status = f"✓ ({len(data_list)} rows)"
                 else:
-                    print("✗ (no data)")
+                    status = "✗ (no data)"
             else:
-                print("✗ (unexpected format)")
+                status = "✗ (unexpected format)"
                 
         except Exception as e:
-            print(f"✗ ({str(e)[:50]})")
+            status = f"✗ ({str(e)[:50]})"
+        
+        # One print per endpoint so concurrent samples don't interleave
+        print(f"Testing {endpoint_name}... {status}")
+        return row_count, field_counts
+    
+    def record_sample(self, endpoint_name: str, row_count: int, field_counts: Counter) -> None:
+        """Add the counts from sample_endpoint() to the inferrer's totals."""
+        if row_count:
+            self.total_responses[endpoint_name] += row_count
+        if field_counts:
+            self.field_presence[endpoint_name].update(field_counts)
     
     def analyze_results(self) -> Dict[str, Set[str]]:
         """
@@ -95,11 +137,10 @@ class RequiredFieldInferrer:
         Returns:
             Set of commonly required field names
         """
-        field_frequency = defaultdict(int)
+        field_frequency = Counter()
         
         for endpoint_fields in required_by_endpoint.values():
-            for field in endpoint_fields:
-                field_frequency[field] += 1
+            field_frequency.update(endpoint_fields)
         
         # Fields required in 3+ endpoints are likely universally required
         common_required = {
@@ -136,42 +177,29 @@ def main():
     
     print(f"Testing endpoints with data from {start_date} to {end_date}:\n")
     
-    # Dataset endpoints
-    inferrer.test_endpoint(
-        'abuc', 'get_datasets_abuc',
-        publishDateTimeFrom=start_str,
-        publishDateTimeTo=end_str
-    )
-    
-    inferrer.test_endpoint(
-        'agpt', 'get_datasets_agpt',
-        publishDateTimeFrom=start_str,
-        publishDateTimeTo=end_str
-    )
-    
-    inferrer.test_endpoint(
-        'freq', 'get_datasets_freq',
-        from_=start_str,
-        to=end_str
-    )
-    
-    inferrer.test_endpoint(
-        'bod', 'get_datasets_bod',
-        from_=start_str,
-        to=end_str
-    )
-    
-    inferrer.test_endpoint(
-        'indod', 'get_datasets_indod',
-        publishDateTimeFrom=start_str,
-        publishDateTimeTo=end_str
-    )
-    
-    inferrer.test_endpoint(
-        'temp', 'get_datasets_temp',
-        publishDateTimeFrom=start_str,
-        publishDateTimeTo=end_str
-    )
+    # Publish-time window shared by most dataset endpoints
+    published = {'publishDateTimeFrom': start_str, 'publishDateTimeTo': end_str}
+    endpoints = [
+        # Dataset endpoints
+        ('abuc', 'get_datasets_abuc', published),
+        ('agpt', 'get_datasets_agpt', published),
+        ('freq', 'get_datasets_freq', {'from_': start_str, 'to': end_str}),
+        ('bod', 'get_datasets_bod', {'from_': start_str, 'to': end_str}),
+        ('indod', 'get_datasets_indod', published),
+        ('temp', 'get_datasets_temp', published),
+    ]
+    
+    # Requests are I/O-bound, so sample all endpoints concurrently; results
+    # are recorded in the order above so the output is deterministic.
+    # Sharing one client is fine: workers only send GETs over urllib3's
+    # thread-safe connection pool.
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as executor:
+        futures = [
+            (name, executor.submit(inferrer.sample_endpoint, name, method_name, **kwargs))
+            for name, method_name, kwargs in endpoints
+        ]
+        for name, future in futures:
+            inferrer.record_sample(name, *future.result())
     
     # Analyze results
     print("\n" + "=" * 70)
@@ -203,8 +231,10 @@ def main():
         }
     }
     
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        output_file.write_text(json.dumps(results, indent=2))
     
     print(f"\n✓ Results saved to: {output_file}")
     print("\nNext steps:")
@@ -7,15 +7,96 @@ potential conflicts.
 """
 
 import ast
+import functools
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    # Optional speedup; fall back to the stdlib parser
+    orjson = None
+
+
+# HTTP methods checked for each spec path, in report order
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_source(source: bytes) -> ast.Module:
+    """Parse Python source; cached on the content so each file is parsed once."""
+    return ast.parse(source)
+
+
+def _load_tree(path: Path) -> Optional[ast.Module]:
+    """Return the parsed module at ``path``, or None if it does not exist."""
+    try:
+        source = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return _parse_source(source)
+
+
+def _iter_public_functions(tree: ast.Module) -> Iterator[ast.FunctionDef]:
+    """
+    Yield public module-level functions, then public methods of each class.
+
+    Only the module body and (nested) class bodies are visited, which is where
+    client methods live, instead of walking every expression node of the tree.
+    Classes are visited breadth-first, in the same order as ``ast.walk``.
+    """
+    bodies = [tree.body]
+    for body in bodies:
+        for node in body:
+            if isinstance(node, ast.FunctionDef):
+                if not node.name.startswith("_"):
+                    yield node
+            elif isinstance(node, ast.ClassDef):
+                bodies.append(node.body)
+
+
+class MethodInfo:
+    """
+    Lazily evaluated details of a client method.
+
+    Most checks only need method names, so the docstring and parameters are
+    extracted from the AST node on first access rather than up front.
+    """
+
+    __slots__ = ("node", "_docstring", "_params")
+
+    def __init__(self, node: ast.FunctionDef):
+        self.node = node
+        self._docstring: Optional[str] = None
+        self._params: Optional[List[str]] = None
+
+    @property
+    def docstring(self) -> str:
+        """Method docstring, or an empty string if it has none."""
+        if self._docstring is None:
+            self._docstring = ast.get_docstring(self.node) or ""
+        return self._docstring
+
+    @property
+    def params(self) -> List[str]:
+        """Positional parameter names, excluding ``self``."""
+        if self._params is None:
+            self._params = [arg.arg for arg in self.node.args.args if arg.arg != "self"]
+        return self._params
+
+    @property
+    def lineno(self) -> int:
+        """Line number of the method definition."""
+        return self.node.lineno
 
 
 class ClientValidator:
     """Validate client code against OpenAPI specification."""
 
+    __slots__ = ("spec", "client_path", "spec_endpoints", "client_methods")
+
     def __init__(self, spec: dict, client_path: Path):
         """
         Initialize the validator.
@@ -27,16 +108,16 @@ class ClientValidator:
         self.spec = spec
         self.client_path = client_path
         self.spec_endpoints = self._extract_spec_endpoints()
-        self.client_methods = self._extract_client_methods()
+        self.client_methods = self._extract_client_methods(_load_tree(client_path))
 
     def _extract_spec_endpoints(self) -> Dict[str, Dict]:
         """Extract all endpoints from OpenAPI spec."""
         endpoints = {}
 
         for path, path_item in self.spec.get("paths", {}).items():
-            for method in ["get", "post", "put", "delete", "patch"]:
-                if method in path_item:
-                    operation = path_item[method]
+            for method in HTTP_METHODS:
+                operation = path_item.get(method)
+                if operation is not None:
                     operation_id = operation.get("operationId", f"{method}_{path}")
                     endpoints[operation_id] = {
                         "path": path,
@@ -47,31 +128,20 @@ class ClientValidator:
 
         return endpoints
 
-    def _extract_client_methods(self) -> Dict[str, Dict]:
-        """Extract all methods from client Python file."""
+    def _extract_client_methods(self, tree: Optional[ast.Module]) -> Dict[str, MethodInfo]:
+        """
+        Extract all public methods from the parsed client module.
+
+        Args:
+            tree: Parsed client module, or None if the file does not exist
+        """
         methods = {}
 
-        if not self.client_path.exists():
+        if tree is None:
             return methods
 
-        with open(self.client_path, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Skip private methods
-                if not node.name.startswith("_"):
-                    # Extract docstring
-                    docstring = ast.get_docstring(node) or ""
-
-                    # Extract parameters
-                    params = [arg.arg for arg in node.args.args if arg.arg != "self"]
-
-                    methods[node.name] = {
-                        "docstring": docstring,
-                        "params": params,
-                        "lineno": node.lineno,
-                    }
+        for node in _iter_public_functions(tree):
+            methods[node.name] = MethodInfo(node)
 
         return methods
 
@@ -79,23 +149,35 @@ class ClientValidator:
         """Find endpoints in spec that are missing from client."""
         missing = []
 
+        # Lowercase every client method name once and join them, so checking a
+        # pattern against all methods is a single substring search. Newlines
+        # never occur in patterns, so a match cannot straddle two names. This
+        # beats an n-gram prefilter, which costs more to build and probe in
+        # Python than the C-level search it would be guarding.
+        method_names = "\n".join(name.lower() for name in self.client_methods)
+        # Path segments repeat across endpoints; remember each segment's result
+        segment_found: Dict[str, bool] = {}
+
         for operation_id, endpoint_info in self.spec_endpoints.items():
             # Check if any client method seems to match this endpoint
             path = endpoint_info["path"]
             method = endpoint_info["method"]
 
-            # Generate expected method name patterns
-            path_parts = [p for p in path.split("/") if p and not p.startswith("{")]
-            expected_patterns = [
-                f"{method}_{part}" for part in path_parts
-            ] + path_parts
-
-            # Check if any client method matches
+            # Expected method name patterns are "{method}_{segment}" and the bare
+            # segment for each literal path segment. Every "{method}_{segment}"
+            # contains its segment, so it can only match when the segment does;
+            # checking the segments alone gives the same answer.
             found = False
-            for client_method in self.client_methods.keys():
-                if any(pattern.lower() in client_method.lower() for pattern in expected_patterns):
-                    found = True
-                    break
+            if self.client_methods:
+                for segment in path.split("/"):
+                    if not segment or segment[0] == "{":
+                        continue
+                    hit = segment_found.get(segment)
+                    if hit is None:
+                        hit = segment_found[segment] = segment.lower() in method_names
+                    if hit:
+                        found = True
+                        break
 
             if not found:
                 missing.append(
@@ -116,7 +198,7 @@ class ClientValidator:
 
         for method_name, method_info in self.client_methods.items():
             # Check if method has a docstring
-            if not method_info["docstring"]:
+            if not method_info.docstring:
                 undocumented.append(method_name)
 
         return undocumented
@@ -198,21 +280,15 @@ def compare_schemas() -> Tuple[List[str], List[str]]:
     existing_methods = set()
     generated_methods = set()
 
-    # Extract methods from existing client
-    if existing_path.exists():
-        with open(existing_path, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
-                    existing_methods.add(node.name)
+    # Extract methods from existing client (already parsed by the validator)
+    tree = _load_tree(existing_path)
+    if tree is not None:
+        existing_methods.update(node.name for node in _iter_public_functions(tree))
 
     # Extract methods from generated client
-    if generated_path.exists():
-        with open(generated_path, "r", encoding="utf-8") as f:
-            tree = ast.parse(f.read())
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
-                    generated_methods.add(node.name)
+    tree = _load_tree(generated_path)
+    if tree is not None:
+        generated_methods.update(node.name for node in _iter_public_functions(tree))
 
     only_existing = sorted(existing_methods - generated_methods)
     only_generated = sorted(generated_methods - existing_methods)
@@ -238,8 +314,11 @@ def main() -> int:
 
     # Load spec
     print(f"Loading OpenAPI spec from: {spec_path}")
-    with open(spec_path, "r", encoding="utf-8") as f:
-        spec = json.load(f)
+    if orjson is not None:
+        spec = orjson.loads(spec_path.read_bytes())
+    else:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
     
     # Handle spec wrapped in array
     if isinstance(spec, list):
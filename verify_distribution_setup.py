@@ -6,153 +6,247 @@ This script checks that all required files and configurations
 are in place for publishing to PyPI.
 """
 
+import argparse
+import functools
+import json
+import os
 import sys
-from pathlib import Path
-
-def check_file(filepath: str, description: str) -> bool:
-    """Check if a file exists."""
-    path = Path(filepath)
-    if path.exists():
-        print(f"✓ {description}: {filepath}")
-        return True
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Content check results from previous runs, keyed by file and its mtime/size
+CACHE_FILE = ".verify_cache.json"
+
+@functools.lru_cache(maxsize=None)
+def _list_dir(directory: str) -> frozenset:
+    """
+    List a directory's existing entry names with a single scandir call.
+    
+    Symlinks are followed like Path.exists(), so dangling links are left out.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(
+                entry.name
+                for entry in entries
+                if not entry.is_symlink() or os.path.exists(entry.path)
+            )
+    except OSError:
+        return frozenset()
+
+def _exists(filepath: str) -> bool:
+    """Check if a path exists using the cached listing of its directory."""
+    directory, name = os.path.split(filepath)
+    return name in _list_dir(directory or ".")
+
+@functools.lru_cache(maxsize=None)
+def _read(filepath: str) -> Optional[str]:
+    """Read a file once and cache its text; None if the file is missing."""
+    if not _exists(filepath):
+        return None
+    with open(filepath) as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=None)
+def _read_version(filepath: str, fingerprint: Tuple[int, int]) -> str:
+    """Read a file once per (mtime_ns, size) fingerprint, so edits are seen."""
+    with open(filepath) as f:
+        return f.read()
+
+def check_file(filepath: str, description: str) -> Tuple[bool, str]:
+    """Check if a file exists; returns the result and its report line."""
+    if _exists(filepath):
+        return True, f"✓ {description}: {filepath}"
     else:
-        print(f"✗ {description}: {filepath} (MISSING)")
-        return False
-
-def check_content(filepath: str, content: str, description: str) -> bool:
-    """Check if a file contains specific content."""
-    path = Path(filepath)
-    if not path.exists():
-        print(f"✗ {description}: {filepath} (FILE MISSING)")
-        return False
+        return False, f"✗ {description}: {filepath} (MISSING)"
+
+def _load_cache() -> Dict[str, Dict]:
+    """Load cached content check results; empty if absent or unreadable."""
+    try:
+        with open(CACHE_FILE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_cache(cache: Dict[str, Dict]) -> None:
+    """Write the cache atomically; failing to save never fails verification."""
+    tmp_file = CACHE_FILE + ".tmp"
+    try:
+        with open(tmp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError:
+        pass
+
+def _contains(filepath: str, content: str, cache: Optional[Dict[str, Dict]]) -> Optional[bool]:
+    """
+    Check if a file contains content; None if the file is missing.
     
+    With a cache, the file is only read when its mtime or size changed since
+    the result was recorded.
+    """
+    if cache is None or not _exists(filepath):
+        text = _read(filepath)
+        return None if text is None else content in text
+    
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
+        # Removed since the directory was listed
+        return None
+    fingerprint = [stat.st_mtime_ns, stat.st_size]
+    entry = cache.get(filepath)
+    if not isinstance(entry, dict) or entry.get("stat") != fingerprint:
+        entry = cache[filepath] = {"stat": fingerprint, "found": {}}
+    found = entry["found"].get(content)
+    if found is None:
+        found = entry["found"][content] = content in _read_version(filepath, tuple(fingerprint))
+    return found
+
+def check_content(
+    filepath: str,
+    content: str,
+    description: str,
+    cache: Optional[Dict[str, Dict]] = None,
+) -> Tuple[bool, str]:
+    """Check if a file contains specific content; returns the result and its report line."""
     try:
-        text = path.read_text()
-        if content in text:
-            print(f"✓ {description}")
-            return True
+        found = _contains(filepath, content, cache)
+        if found is None:
+            return False, f"✗ {description}: {filepath} (FILE MISSING)"
+        if found:
+            return True, f"✓ {description}"
         else:
-            print(f"✗ {description} (CONTENT MISSING)")
-            return False
+            return False, f"✗ {description} (CONTENT MISSING)"
     except Exception as e:
-        print(f"✗ {description}: Error reading file: {e}")
-        return False
+        return False, f"✗ {description}: Error reading file: {e}"
+
+# Report banner, followed by a blank line
+HEADER = """\
+╔==========================================================╗
+║          PyPI Distribution Setup Verification            ║
+╚==========================================================╝
+"""
+
+# Files that must exist, grouped by report section
+FILE_CHECKS = (
+    ("Essential Files", (
+        ("README.md", "README"),
+        ("LICENSE", "License"),
+        ("pyproject.toml", "Build configuration"),
+        ("setup.py", "Setup script"),
+        ("MANIFEST.in", "Manifest"),
+        ("requirements.txt", "Requirements"),
+        ("requirements-dev.txt", "Dev requirements"),
+    )),
+    ("Package Structure", (
+        ("elexon_bmrs/__init__.py", "Package __init__"),
+        ("elexon_bmrs/client.py", "Client module"),
+        ("elexon_bmrs/models.py", "Models module"),
+        ("elexon_bmrs/exceptions.py", "Exceptions module"),
+        ("elexon_bmrs/generated_models.py", "Generated models"),
+        ("elexon_bmrs/py.typed", "Type information marker"),
+    )),
+    ("Documentation", (
+        ("CONTRIBUTING.md", "Contributing guide"),
+        ("PYPI_DISTRIBUTION.md", "PyPI distribution guide"),
+        ("CHANGELOG.md", "Changelog"),
+    )),
+    ("Configuration", (
+        (".gitignore", "Git ignore"),
+        (".pypirc.template", "PyPI config template"),
+        ("Makefile", "Make targets"),
+    )),
+)
+
+# Content each file must contain, as (file, content, description), grouped by
+# report section
+CONTENT_CHECKS = (
+    ("Configuration Content", (
+        ("pyproject.toml", "elexon-bmrs", "Package name in pyproject.toml"),
+        ("pyproject.toml", "version =", "Version in pyproject.toml"),
+        ("pyproject.toml", "readme =", "README reference in pyproject.toml"),
+        ("MANIFEST.in", "include README.md", "README in MANIFEST.in"),
+        ("MANIFEST.in", "include LICENSE", "LICENSE in MANIFEST.in"),
+        ("requirements-dev.txt", "build>=", "Build tool in dev requirements"),
+        ("requirements-dev.txt", "twine>=", "Twine tool in dev requirements"),
+    )),
+    ("Makefile Targets", (
+        ("Makefile", "build:", "Build target"),
+        ("Makefile", "check-build:", "Check-build target"),
+        ("Makefile", "upload-test:", "Upload-test target"),
+        ("Makefile", "upload:", "Upload target"),
+        ("Makefile", "pre-release:", "Pre-release target"),
+    )),
+)
 
-def main():
+def _run_sections(cache: Dict[str, Dict]) -> Iterator[Tuple[str, List[Tuple[bool, str]]]]:
+    """Yield each report section with the (ok, line) results of its checks."""
+    for section, files in FILE_CHECKS:
+        yield section, [check_file(filepath, description) for filepath, description in files]
+    for section, contents in CONTENT_CHECKS:
+        yield section, [
+            check_content(filepath, content, description, cache)
+            for filepath, content, description in contents
+        ]
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Run all checks."""
-    print("╔" + "=" * 58 + "╗")
-    print("║" + " " * 10 + "PyPI Distribution Setup Verification" + " " * 12 + "║")
-    print("╚" + "=" * 58 + "╝\n")
-    
-    checks = []
+    parser = argparse.ArgumentParser(description="Verify PyPI distribution setup is correct.")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Stop after the first section with a failing check",
+    )
+    args = parser.parse_args(argv)
     
-    # Essential files
-    print("Essential Files:")
-    print("-" * 60)
-    checks.append(check_file("README.md", "README"))
-    checks.append(check_file("LICENSE", "License"))
-    checks.append(check_file("pyproject.toml", "Build configuration"))
-    checks.append(check_file("setup.py", "Setup script"))
-    checks.append(check_file("MANIFEST.in", "Manifest"))
-    checks.append(check_file("requirements.txt", "Requirements"))
-    checks.append(check_file("requirements-dev.txt", "Dev requirements"))
-    print()
+    # Listings and file contents are only valid for a single run
+    _list_dir.cache_clear()
+    _read.cache_clear()
+    _read_version.cache_clear()
     
-    # Package structure
-    print("Package Structure:")
-    print("-" * 60)
-    checks.append(check_file("elexon_bmrs/__init__.py", "Package __init__"))
-    checks.append(check_file("elexon_bmrs/client.py", "Client module"))
-    checks.append(check_file("elexon_bmrs/models.py", "Models module"))
-    checks.append(check_file("elexon_bmrs/exceptions.py", "Exceptions module"))
-    checks.append(check_file("elexon_bmrs/generated_models.py", "Generated models"))
-    checks.append(check_file("elexon_bmrs/py.typed", "Type information marker"))
-    print()
+    # Report lines are collected and written in one go at the end
+    out = [HEADER]
     
-    # Documentation
-    print("Documentation:")
-    print("-" * 60)
-    checks.append(check_file("CONTRIBUTING.md", "Contributing guide"))
-    checks.append(check_file("PYPI_DISTRIBUTION.md", "PyPI distribution guide"))
-    checks.append(check_file("CHANGELOG.md", "Changelog"))
-    print()
-    
-    # Configuration files
-    print("Configuration:")
-    print("-" * 60)
-    checks.append(check_file(".gitignore", "Git ignore"))
-    checks.append(check_file(".pypirc.template", "PyPI config template"))
-    checks.append(check_file("Makefile", "Make targets"))
-    print()
+    checks = []
+    cache = _load_cache()
     
-    # Content checks
-    print("Configuration Content:")
-    print("-" * 60)
-    checks.append(check_content(
-        "pyproject.toml",
-        "elexon-bmrs",
-        "Package name in pyproject.toml"
-    ))
-    checks.append(check_content(
-        "pyproject.toml",
-        "version =",
-        "Version in pyproject.toml"
-    ))
-    checks.append(check_content(
-        "pyproject.toml",
-        "readme =",
-        "README reference in pyproject.toml"
-    ))
-    checks.append(check_content(
-        "MANIFEST.in",
-        "include README.md",
-        "README in MANIFEST.in"
-    ))
-    checks.append(check_content(
-        "MANIFEST.in",
-        "include LICENSE",
-        "LICENSE in MANIFEST.in"
-    ))
-    checks.append(check_content(
-        "requirements-dev.txt",
-        "build>=",
-        "Build tool in dev requirements"
-    ))
-    checks.append(check_content(
-        "requirements-dev.txt",
-        "twine>=",
-        "Twine tool in dev requirements"
-    ))
-    print()
+    # Sections are run lazily, so --fast skips the checks after a failure
+    for section, results in _run_sections(cache):
+        out.append(f"{section}:")
+        out.append("-" * 60)
+        for ok, line in results:
+            checks.append(ok)
+            out.append(line)
+        out.append("")
+        if args.fast and not all(ok for ok, _ in results):
+            out.append("Remaining checks skipped (--fast)")
+            out.append("")
+            break
     
-    # Makefile targets
-    print("Makefile Targets:")
-    print("-" * 60)
-    checks.append(check_content("Makefile", "build:", "Build target"))
-    checks.append(check_content("Makefile", "check-build:", "Check-build target"))
-    checks.append(check_content("Makefile", "upload-test:", "Upload-test target"))
-    checks.append(check_content("Makefile", "upload:", "Upload target"))
-    checks.append(check_content("Makefile", "pre-release:", "Pre-release target"))
-    print()
+    _save_cache(cache)
     
     # Summary
-    print("=" * 60)
+    out.append("=" * 60)
     passed = sum(checks)
     total = len(checks)
-    print(f"\nResults: {passed}/{total} checks passed")
+    out.append(f"\nResults: {passed}/{total} checks passed")
     
     if passed == total:
-        print("\n✓ All checks passed! Package is ready for PyPI distribution.")
-        print("\nNext steps:")
-        print("  1. Install dev dependencies: pip install -e '.[dev]'")
-        print("  2. Run pre-release checks: make pre-release")
-        print("  3. Test on TestPyPI: make upload-test")
-        print("  4. Publish to PyPI: make upload")
-        print("\nSee PYPI_DISTRIBUTION.md for detailed instructions.")
-        return 0
+        out.append("\n✓ All checks passed! Package is ready for PyPI distribution.")
+        out.append("\nNext steps:")
+        out.append("  1. Install dev dependencies: pip install -e '.[dev]'")
+        out.append("  2. Run pre-release checks: make pre-release")
+        out.append("  3. Test on TestPyPI: make upload-test")
+        out.append("  4. Publish to PyPI: make upload")
+        out.append("\nSee PYPI_DISTRIBUTION.md for detailed instructions.")
+        status = 0
     else:
-        print(f"\n✗ {total - passed} check(s) failed. Please fix the issues above.")
-        return 1
+        out.append(f"\n✗ {total - passed} check(s) failed. Please fix the issues above.")
+        status = 1
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    return status
 
 if __name__ == "__main__":
     sys.exit(main())
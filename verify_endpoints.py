@@ -4,39 +4,50 @@ Verify that all 287 BMRS API endpoints are accessible through the client.
 
 This script checks that the BMRSClient properly inherits from GeneratedBMRSMethods
 and that all endpoints are available.
+
+Importing this module is cheap: elexon_bmrs is only imported when
+verify_endpoints() runs.
 """
 
+__all__ = ['verify_endpoints']
+
 def verify_endpoints():
     """Verify all 287 endpoints are accessible."""
     try:
+        # Imported here so the client package loads only when checking
         from elexon_bmrs import BMRSClient
         
-        # Create client instance
-        client = BMRSClient()
+        # Methods are defined on the class, so inspect it directly rather
+        # than constructing a client (and its HTTP session)
+        client_cls = BMRSClient
         
-        # Get all get_ methods
-        methods = [m for m in dir(client) if m.startswith('get_')]
+        # Get all get_ methods from the class hierarchy; unlike dir() this
+        # skips sorting every attribute name
+        methods = set()
+        for klass in client_cls.__mro__:
+            methods.update(name for name in vars(klass) if name[:4] == 'get_')
         
-        print(f"✅ Total get_ methods found: {len(methods)}")
+        method_count = len(methods)
+        print(f"✅ Total get_ methods found: {method_count}")
         
-        if len(methods) == 287:
+        if method_count == 287:
             print("🎉 SUCCESS: All 287 endpoints are accessible!")
         else:
-            print(f"❌ ERROR: Expected 287 methods, found {len(methods)}")
+            print(f"❌ ERROR: Expected 287 methods, found {method_count}")
             return False
         
         # Test a few key methods exist
-        key_methods = [
+        key_methods = (
             'get_balancing_dynamic',
-            'get_generation_actual_per_type', 
+            'get_generation_actual_per_type',
             'get_demand_outturn_national',
             'get_datasets_freq',
-            'get_system_frequency'
-        ]
+            'get_system_frequency',
+        )
         
         print("\n🔍 Testing key methods:")
         for method in key_methods:
-            if hasattr(client, method):
+            if method in methods:
                 print(f"  ✅ {method}")
             else:
                 print(f"  ❌ {method} - MISSING!")
@@ -44,11 +55,10 @@ def verify_endpoints():
         
         # Test method documentation
         print("\n📚 Testing method documentation:")
-        try:
-            help_text = help(client.get_balancing_dynamic)
+        if client_cls.get_balancing_dynamic.__doc__:
             print("  ✅ Method documentation accessible")
-        except Exception as e:
-            print(f"  ❌ Method documentation error: {e}")
+        else:
+            print("  ❌ Method documentation missing")
             return False
         
         print("\n🎯 All verification tests passed!")